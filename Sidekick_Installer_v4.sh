@@ -51,11 +51,6 @@ install_python_deps() {
         packages+=("psutil")
     fi
 
-    # Check filelock (required for v4)
-    if ! python3 -c "import filelock" 2>/dev/null; then
-        packages+=("filelock")
-    fi
-
     # Check qdarkstyle
     if ! python3 -c "import qdarkstyle" 2>/dev/null; then
         packages+=("qdarkstyle")
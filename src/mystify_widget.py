@@ -5,7 +5,9 @@ A PyQt6 implementation of the classic Windows Mystify screensaver
 featuring flowing geometric shapes with customizable trails and colors.
 """
 
+import os
 import random
+import re
 import sys
 import logging
 from pathlib import Path
@@ -16,6 +18,9 @@ from PyQt6.QtGui import QPainter, QPen, QColor, QPainterPath
 
 import time
 
+# Per-frame and per-poll diagnostics are only produced with SIDEKICK_DEBUG=1
+DEBUG = os.environ.get('SIDEKICK_DEBUG', '0') not in ('', '0')
+
 # Setup debug logging
 def setup_debug_logging() -> logging.Logger:
     """Setup debug logging to mystify_debug.log"""
@@ -23,7 +28,7 @@ def setup_debug_logging() -> logging.Logger:
 
     # Configure logging
     logging.basicConfig(
-        level=logging.DEBUG,
+        level=logging.DEBUG if DEBUG else logging.INFO,
         format='%(asctime)s [%(levelname)s] %(message)s',
         handlers=[
             logging.FileHandler(log_file, mode='w'),  # Overwrite each run
@@ -39,6 +44,12 @@ def setup_debug_logging() -> logging.Logger:
 # Initialize debug logger
 debug_logger = setup_debug_logging()
 
+# /proc/interrupts rows for USB/HID controllers; group 1 is the per-CPU counts
+_USB_IRQ_LINE = re.compile(
+    rb'^[ \t]*\S+:((?:[ \t]+\d+)+)[^\n]*?(?:usb|ehci|ohci|xhci|hid|input|mouse|keyboard)',
+    re.MULTILINE | re.IGNORECASE,
+)
+
 class MystifyWidget(QWidget):
     """Mystify screensaver with flowing geometric patterns and trails"""
 
@@ -90,19 +101,21 @@ class MystifyWidget(QWidget):
 
         debug_logger.info(f"Animation timer started - FPS: {fps}, interval: {1000 // fps}ms")
 
-        # USB Activity Monitoring Timer for physical input detection
-        self.usb_monitor_timer = QTimer()
-        self.usb_monitor_timer.timeout.connect(self.check_usb_activity)
+        # USB Activity Monitoring for physical input detection - polled from
+        # update_animation like the CPU check, so it needs no timer of its own
         self.usb_interrupt_baseline = None
         self.last_usb_check = time.time()
+        self.last_usb_error: Optional[str] = None
+        self.interrupts_file = None  # /proc/interrupts, kept open between polls
+        self.usb_check_interval = 2.0
         self.screensaver_start_time = time.time()  # Track when screensaver started
 
-        # Start USB monitoring every 2 seconds (less frequent to avoid false positives)
+        # Check USB activity every 2 seconds (less frequent to avoid false positives)
         # and only after the screensaver has been running for at least 5 seconds
         # Disable USB monitoring if show_stats is enabled (likely test mode)
-        if not self.show_stats:
-            self.usb_monitor_timer.start(2000)
-            debug_logger.info("USB monitoring timer started (2000ms interval)")
+        self.usb_monitoring = not self.show_stats
+        if self.usb_monitoring:
+            debug_logger.info("USB monitoring started (2000ms interval)")
         else:
             debug_logger.info("USB monitoring disabled in test mode (show_stats=True)")
             print("🔌 USB monitoring disabled in test mode (show_stats=True)")
@@ -124,7 +137,6 @@ class MystifyWidget(QWidget):
         # Creating new Process() each time causes cpu_percent() to return 0.0
         try:
             import psutil
-            import os
             self.current_process = psutil.Process(os.getpid())
             self.current_process.cpu_percent()  # Baseline call (first call returns 0.0)
         except ImportError:
@@ -134,7 +146,6 @@ class MystifyWidget(QWidget):
         # Creating new Process() each time causes cpu_percent() to return 0.0
         try:
             import psutil
-            import os
             self.current_process = psutil.Process(os.getpid())
             self.current_process.cpu_percent()  # Baseline call (first call returns 0.0)
         except ImportError:
@@ -290,7 +301,7 @@ class MystifyWidget(QWidget):
                 debug_msg = f"🎯 Mystify animation running - Frame {self.frame_count}, Quality: {self.quality_level:.2f}, Shapes: {len(self.shapes)}"
                 print(debug_msg)
                 debug_logger.info(debug_msg)
-                debug_logger.info(f"Timer status - animation timer active: {self.timer.isActive()}, USB timer active: {self.usb_monitor_timer.isActive()}")
+                debug_logger.info(f"Timer status - animation timer active: {self.timer.isActive()}, USB monitoring: {self.usb_monitoring}")
                 debug_logger.info(f"Performance - delta_time: {delta_time:.4f}s, skip_ratio: {self.frame_skip_ratio}")
                 self._last_debug_print = current_time
         else:
@@ -328,7 +339,6 @@ class MystifyWidget(QWidget):
 
         try:
             import psutil
-            import os
 
             # Update stats every second
             if current_time - self.last_stats_update >= 1.0:
@@ -380,7 +390,7 @@ class MystifyWidget(QWidget):
         start_idx = self.frame_count % len(self.shapes)
 
         # Debug: Check if shapes are being processed
-        if self.frame_count % 150 == 0:  # Every 5 seconds at 30fps
+        if DEBUG and self.frame_count % 150 == 0:  # Every 5 seconds at 30fps
             print(f"🔍 Mystify details - Shapes per frame: {shapes_per_frame}, Quality: {self.quality_level:.3f}, Total shapes: {len(self.shapes)}")
 
         for idx in range(shapes_per_frame):
@@ -450,8 +460,14 @@ class MystifyWidget(QWidget):
             self.last_emergency_check = current_time
             self.check_emergency_cpu_throttle()
 
+        # USB ACTIVITY: Poll /proc/interrupts every 2 seconds on the frame tick
+        if self.usb_monitoring and current_time - self.last_usb_check >= self.usb_check_interval:
+            self.last_usb_check = current_time
+            self.check_usb_activity()
+
         # Handle debug information
-        self._update_debug_info(current_time, delta_time)
+        if DEBUG:
+            self._update_debug_info(current_time, delta_time)
 
         # PERFORMANCE: Frame skipping DISABLED for smooth animation
         self.skip_frame_counter += 1
@@ -761,39 +777,24 @@ class MystifyWidget(QWidget):
         try:
             current_time = time.time()
 
-            debug_logger.debug(f"USB check triggered at {current_time:.2f}")
+            debug_logger.debug("USB check triggered at %.2f", current_time)
 
             # Don't monitor USB activity for the first 10 seconds to avoid false positives during startup
             time_since_start = current_time - self.screensaver_start_time
             if time_since_start < 10.0:
-                debug_logger.debug(f"USB monitoring skipped - startup grace period ({time_since_start:.1f}s < 10s)")
+                debug_logger.debug("USB monitoring skipped - startup grace period (%.1fs < 10s)", time_since_start)
                 return
 
-            # Read USB/HID interrupt data from /proc/interrupts
-            with open('/proc/interrupts', 'r', encoding='utf-8') as f:
-                content = f.read()
-
-            usb_interrupts = 0
-            hid_interrupts = 0
-
-            # Look for ALL USB/HID related interrupts
-            for line in content.split('\n'):
-                line_lower = line.lower()
-                if any(keyword in line_lower for keyword in ['usb', 'ehci', 'ohci', 'xhci', 'hid', 'input', 'mouse', 'keyboard']):
-                    parts = line.split()
-                    if len(parts) > 1:
-                        # Sum all CPU columns (skip first column which is IRQ number)
-                        for i in range(1, len(parts)):
-                            if parts[i].isdigit():
-                                if 'usb' in line_lower or 'ehci' in line_lower or 'ohci' in line_lower or 'xhci' in line_lower:
-                                    usb_interrupts += int(parts[i])
-                                else:
-                                    hid_interrupts += int(parts[i])
-                            else:
-                                break
-
-            total_interrupts = usb_interrupts + hid_interrupts
-            debug_logger.debug(f"Interrupt counts - USB: {usb_interrupts}, HID: {hid_interrupts}, Total: {total_interrupts}")
+            # procfs regenerates the file on every read from offset 0
+            if self.interrupts_file is None:
+                self.interrupts_file = open('/proc/interrupts', 'rb', buffering=0)
+            self.interrupts_file.seek(0)
+            content = self.interrupts_file.read()
+
+            # Sum the per-CPU counts of every USB/HID row in one regex pass
+            total_interrupts = sum(int(count) for match in _USB_IRQ_LINE.finditer(content)
+                                   for count in match.group(1).split())
+            debug_logger.debug("Interrupt count - USB/HID total: %d", total_interrupts)
 
             # Initialize baseline on first run
             if self.usb_interrupt_baseline is None:
@@ -806,7 +807,7 @@ class MystifyWidget(QWidget):
             # Use a higher threshold to avoid false positives from system activity
             # Only exit if there's significant interrupt activity (more than 50 interrupts)
             interrupt_diff = total_interrupts - self.usb_interrupt_baseline
-            debug_logger.debug(f"Interrupt diff: {interrupt_diff} (threshold: 50)")
+            debug_logger.debug("Interrupt diff: %d (threshold: 50)", interrupt_diff)
 
             if interrupt_diff > 50:  # Higher threshold to reduce false positives
                 exit_msg = f"🔌 Mystify significant USB activity detected! +{interrupt_diff} interrupts - Exiting screensaver..."
@@ -820,12 +821,19 @@ class MystifyWidget(QWidget):
             else:
                 # Update baseline for next check (gradual adjustment to avoid drift)
                 self.usb_interrupt_baseline = total_interrupts
-                debug_logger.debug(f"USB activity below threshold - baseline updated to {total_interrupts}")
+                debug_logger.debug("USB activity below threshold - baseline updated to %d", total_interrupts)
 
         except Exception as e:
-            # If we can't read interrupts, fall back to timer-based check
-            debug_logger.error(f"USB monitoring error: {e}")
-            pass
+            # Reopen on the next poll in case the handle itself went bad
+            if self.interrupts_file is not None:
+                self.interrupts_file.close()
+                self.interrupts_file = None
+            # If we can't read interrupts, log each distinct error once
+            # rather than on every 2 second poll
+            error = str(e)
+            if error != self.last_usb_error:
+                debug_logger.error("USB monitoring error: %s", error)
+                self.last_usb_error = error
 
 class MystifyScreensaver:
     """Main mystify screensaver class"""
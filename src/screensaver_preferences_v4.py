@@ -28,38 +28,37 @@ import sys
 import os
 import json
 import subprocess
-import datetime
 import time
 import atexit
-import webbrowser
+import fcntl
+import re
+import shutil
+import importlib
+import tempfile
 from pathlib import Path
-from typing import Optional
+from types import MappingProxyType
+from typing import Dict, Optional, Tuple
 
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
     QLabel, QPushButton, QSlider, QSpinBox, QFrame, QStackedWidget,
     QComboBox, QDoubleSpinBox, QFileDialog, QMessageBox, QStatusBar,
-    QSystemTrayIcon, QMenu, QSplashScreen
+    QSystemTrayIcon, QMenu, QSplashScreen, QButtonGroup
 )
-from PyQt6.QtCore import Qt, QTimer, pyqtSignal, QPropertyAnimation, QEasingCurve, QPoint, QByteArray, QSize
+from PyQt6.QtCore import Qt, QTimer, pyqtSignal, pyqtSlot, QPropertyAnimation, QEasingCurve, QPoint, QSize
 from PyQt6.QtGui import QIcon, QPainter, QColor, QAction, QPixmap
 
 # =============================================================================
 # SINGLE INSTANCE PROTECTION
 # =============================================================================
 
-try:
-    from filelock import Timeout, FileLock
-    FILELOCK_AVAILABLE = True
-except ImportError:
-    FILELOCK_AVAILABLE = False
-
 class SingleInstanceManager:
-    """Professional single instance manager with file locking"""
+    """Professional single instance manager with file locking (fcntl.flock)"""
+    __slots__ = ('app_name', 'lock_fd', 'is_locked', 'lock_dir', 'lock_file_path')
+
     def __init__(self, app_name: str = "sidekick_screensaver_v4", lock_dir: Optional[str] = None):
         self.app_name = app_name
-        self.lock_file = None
-        self.lock = None
+        self.lock_fd: Optional[int] = None
         self.is_locked = False
         if lock_dir:
             self.lock_dir = Path(lock_dir)
@@ -69,36 +68,214 @@ class SingleInstanceManager:
             else:
                 self.lock_dir = Path.cwd()
         self.lock_file_path = self.lock_dir / f"{self.app_name}.lock"
-        if FILELOCK_AVAILABLE:
-            self.lock = FileLock(str(self.lock_file_path))
-        else:
-            self.lock = None
 
     def acquire_lock(self, timeout: float = 0.0) -> bool:
         """Acquire file lock with optional timeout"""
-        if not FILELOCK_AVAILABLE:
+        if self.is_locked:
             return True
-        if not self.lock:
-            return False
         try:
-            self.lock.acquire(timeout=timeout)
-            self.is_locked = True
-            atexit.register(self.release_lock)
-            return True
-        except Timeout:
-            return False
-        except Exception:
+            self.lock_fd = os.open(str(self.lock_file_path), os.O_RDWR | os.O_CREAT, 0o644)
+        except OSError:
             return False
 
+        deadline = time.monotonic() + timeout
+        while True:
+            try:
+                fcntl.flock(self.lock_fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                break
+            except BlockingIOError:
+                if time.monotonic() >= deadline:
+                    os.close(self.lock_fd)
+                    self.lock_fd = None
+                    return False
+                time.sleep(0.05)
+            except OSError:
+                os.close(self.lock_fd)
+                self.lock_fd = None
+                return False
+
+        self.is_locked = True
+        atexit.register(self.release_lock)
+        return True
+
     def release_lock(self):
         """Release the file lock"""
-        if not self.is_locked or not self.lock:
+        if not self.is_locked or self.lock_fd is None:
             return
         try:
-            self.lock.release()
-            self.is_locked = False
-        except Exception:
+            fcntl.flock(self.lock_fd, fcntl.LOCK_UN)
+            os.close(self.lock_fd)
+        except OSError:
             pass
+        self.lock_fd = None
+        self.is_locked = False
+
+# =============================================================================
+# BUILD INFO
+# =============================================================================
+
+_BUILD_DATE: Optional[str] = None
+
+def get_build_date() -> str:
+    """Build date shown in the About dialog (computed on first use)"""
+    global _BUILD_DATE
+    if _BUILD_DATE is None:
+        import datetime
+        _BUILD_DATE = datetime.datetime.now().strftime("%Y-%m-%d")
+    return _BUILD_DATE
+
+# About dialog body; {version} and {build_date} are filled in by show_about
+ABOUT_HTML = """<h3>🎬 Sidekick Screensaver</h3>
+<p><b>Version:</b> {version} (Modern UI Edition)</p>
+<p><b>Updated:</b> {build_date}</p>
+<p><b>Developer:</b> Guy Mayer</p>
+
+<h4>👋 About the Developer:</h4>
+<p>Hello! I'm a professional photographer and tango teacher, but my other full-time passion is coding.</p>
+
+<p>I'm currently stuck on a major 'bug': The resources I need to level up (pro courses, new software, hosting) cost money. It's the one 'refactor' I can't do alone.</p>
+
+<p><b>You can be the hero who helps me resolve this ticket.</b></p>
+
+<p>Every coffee you send is a direct contribution to my coding 'stack.' You're not just donating; you're actively helping me debug my finances so I can get back to building.</p>
+
+<p>I can't wait to see what we build. Thank you for your support!</p>
+
+<h4>🛠️ Features:</h4>
+<ul>
+<li>Multiple screensaver modes (Matrix, Mystify, Slideshow)</li>
+<li>System tray integration</li>
+<li>Auto-shutdown timer</li>
+<li>Performance monitoring</li>
+<li>Multi-display support</li>
+</ul>"""
+
+# =============================================================================
+# SETTINGS FILE I/O
+# =============================================================================
+
+# Resolved once at import; Path.home() falls back to a pwd lookup on every call
+_HOME = os.environ.get('HOME') or os.path.expanduser('~')
+CONFIG_DIR = os.path.join(_HOME, '.config', 'screensaver')
+CONFIG_FILE = os.path.join(CONFIG_DIR, 'settings.json')
+AUTOSTART_DIR = os.path.join(_HOME, '.config', 'autostart')
+AUTOSTART_FILE = os.path.join(AUTOSTART_DIR, 'screensaver-preferences-v4.desktop')
+LOCAL_BIN_DIR = os.path.join(_HOME, '.local', 'bin')
+
+AUTOSTART_DESKTOP_ENTRY = """[Desktop Entry]
+Type=Application
+Name=Screensaver Preferences v4
+Comment=Modern screensaver control panel
+Exec={exec_path}
+Icon=preferences-desktop-screensaver
+Terminal=false
+Categories=Settings;System;
+X-GNOME-Autostart-enabled=true
+StartupNotify=false
+"""
+
+# Default settings (same as original) - read-only, copied into each window
+DEFAULT_SETTINGS = MappingProxyType({
+    'enabled': True,
+    'effect': 'matrix',
+    'matrix_mode': True,
+    'color': 'green',
+    'speed': 25,
+    'lock_timeout': 300,
+    'display_timeout': 600,
+    'rainbow_mode': False,
+    'bold_text': True,
+    'async_scroll': True,
+    'display_target': 'both',
+    'physical_only': True,
+    'start_on_boot': False,
+    'show_taskbar_icon': True,
+    'start_maximized': False,
+    'show_stats': False,
+    'target_fps': 15,
+    'auto_cpu_limit': False,
+    'use_katakana': True,
+    'font_size': 14,
+    'slideshow_mode': False,
+    'slideshow_folder': os.path.join(_HOME, 'screensaver-media', 'images'),
+    'slide_duration': 5.0,
+    'slideshow_random': True,
+    'slideshow_fit_mode': 'contain',
+    'mystify_mode': False,
+    'mystify_shapes': 3,
+    'mystify_trail_length': 50,
+    'mystify_complexity': 6,
+    'mystify_speed': 2,
+    'mystify_color_mode': 'rainbow',
+    'mystify_fill': False,
+    'mystify_color_hue': 240,
+    'mystify_color_hue1': 240,
+    'mystify_color_hue2': 60,
+    'dark_mode': True,
+    'auto_shutdown': False,
+    'shutdown_timeout': 60,
+    'auto_update_check': True,
+    'last_update_check': '',
+    'update_check_frequency': 30,
+    'update_notification': True,
+    'stats_drift': True,
+    'video_mode': False,
+    'video_folder': os.path.join(_HOME, 'screensaver-media', 'videos'),
+    'video_random': True,
+    'video_playback_speed': 1.0,
+    'video_mute': True,
+    'enable_touch_ui': False,  # Manual touch UI override
+    'display_shutdown': False,
+    'display_shutdown_timeout': 30,
+})
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Last parsed settings per file, keyed by path -> (mtime_ns, settings)
+_SETTINGS_FILE_CACHE: Dict[str, Tuple[int, dict]] = {}
+
+def read_settings_file(path) -> dict:
+    """Read a settings JSON file, reusing the last parse while its mtime is unchanged
+
+    Raises FileNotFoundError if the file does not exist.
+    """
+    key = str(path)
+    mtime = os.stat(key).st_mtime_ns
+    cached = _SETTINGS_FILE_CACHE.get(key)
+    if cached is not None and cached[0] == mtime:
+        return dict(cached[1])
+
+    with open(key, 'rb') as f:
+        raw = f.read()
+    data = orjson.loads(raw) if ORJSON_AVAILABLE else json.loads(raw)
+    _SETTINGS_FILE_CACHE[key] = (mtime, data)
+    return dict(data)
+
+def write_settings_file(path, settings: dict) -> None:
+    """Write settings as indented JSON and refresh the read cache
+
+    Skips the write when the file still holds exactly these settings.
+    """
+    key = str(path)
+    cached = _SETTINGS_FILE_CACHE.get(key)
+    if cached is not None and cached[1] == settings:
+        try:
+            if os.stat(key).st_mtime_ns == cached[0]:
+                return
+        except FileNotFoundError:
+            pass
+
+    if ORJSON_AVAILABLE:
+        payload = orjson.dumps(settings, option=orjson.OPT_INDENT_2)
+    else:
+        payload = json.dumps(settings, indent=2).encode('utf-8')
+    with open(key, 'wb') as f:
+        f.write(payload)
+    _SETTINGS_FILE_CACHE[key] = (os.stat(key).st_mtime_ns, dict(settings))
 
 # =============================================================================
 # MODERN 2025 COLOR PALETTE
@@ -133,7 +310,60 @@ def css(stylesheet: str) -> str:
     """Language injection helper for CSS syntax highlighting"""
     return stylesheet
 
+# Minified stylesheets keyed by (theme, touch_mode) - Qt re-parses on every
+# setStyleSheet, so build each variant once and hand back the same string
+_STYLESHEET_CACHE: Dict[Tuple[str, object], str] = {}
+_QSS_COMMENT_RE = re.compile(r'/\*.*?\*/', re.DOTALL)
+_QSS_WHITESPACE_RE = re.compile(r'\s+')
+
+def minify_qss(stylesheet: str) -> str:
+    """Strip comments and collapse whitespace so Qt's CSS parser has less to walk"""
+    stylesheet = _QSS_COMMENT_RE.sub('', stylesheet)
+    return _QSS_WHITESPACE_RE.sub(' ', stylesheet).strip()
+
 def get_stylesheet(theme: str = 'dark', touch_mode: bool = False) -> str:
+    """Return the cached stylesheet for theme and touch mode"""
+    key = (theme, touch_mode)
+    stylesheet = _STYLESHEET_CACHE.get(key)
+    if stylesheet is None:
+        stylesheet = _STYLESHEET_CACHE[key] = minify_qss(_build_stylesheet(theme, touch_mode))
+    return stylesheet
+
+def get_messagebox_stylesheet(theme: str = 'dark') -> str:
+    """Return the cached message box stylesheet for theme"""
+    key = ('messagebox', theme)
+    stylesheet = _STYLESHEET_CACHE.get(key)
+    if stylesheet is None:
+        COLORS = COLORS_DARK if theme == 'dark' else COLORS_LIGHT
+        stylesheet = _STYLESHEET_CACHE[key] = minify_qss(f"""
+        QMessageBox {{
+            background-color: {COLORS['bg_content']};
+            color: {COLORS['text_primary']};
+        }}
+        QMessageBox QLabel {{
+            color: {COLORS['text_primary']};
+            font-size: 14px;
+        }}
+        QMessageBox QPushButton {{
+            background-color: {COLORS['accent_blue']};
+            color: white;
+            border: none;
+            border-radius: 6px;
+            padding: 8px 20px;
+            font-size: 14px;
+            font-weight: 500;
+            min-width: 80px;
+        }}
+        QMessageBox QPushButton:hover {{
+            background-color: #2563EB;
+        }}
+        QMessageBox QPushButton:pressed {{
+            background-color: #1D4ED8;
+        }}
+    """)
+    return stylesheet
+
+def _build_stylesheet(theme: str, touch_mode: bool) -> str:
     """Generate stylesheet based on theme and touch mode"""
     COLORS = COLORS_DARK if theme == 'dark' else COLORS_LIGHT
 
@@ -341,6 +571,72 @@ QStatusBar {{
 }}
 """)
 
+# =============================================================================
+# ICONS
+# =============================================================================
+
+_SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+_DEV_LOGO_DIR = os.path.join(os.path.dirname(_SCRIPT_DIR), "media", "Logo")
+
+# (22x22 tray favicon, 600x600 window favicon) per dark_mode value
+_FAVICON_FILES = {
+    True: ("SideKick_Logo_2025_Favicon_22.png", "SideKick_Logo_2025_Favicon.png"),
+    False: ("SideKick_Logo_2025_Favicon_light_22.png", "SideKick_Logo_2025_Favicon_light.png"),
+}
+
+# Theme icon names tried in order when no custom favicon is installed
+_THEME_ICON_NAMES = (
+    "preferences-desktop-screensaver",
+    "xscreensaver",
+    "screensaver",
+    "preferences-desktop",
+    "video-display",
+)
+
+# Resolved app icon per dark_mode value (window and tray share it)
+_APP_ICON_CACHE: Dict[bool, QIcon] = {}
+
+_FALLBACK_ICON: Optional[QIcon] = None
+
+def fallback_app_icon() -> QIcon:
+    """Icon used when no favicon is installed (same for both themes, resolved once)"""
+    global _FALLBACK_ICON
+    if _FALLBACK_ICON is not None:
+        return _FALLBACK_ICON
+
+    # Fallback to system theme icons
+    for icon_name in _THEME_ICON_NAMES:
+        icon = QIcon.fromTheme(icon_name)
+        if not icon.isNull():
+            print(f"✅ Using icon: {icon_name}")
+            _FALLBACK_ICON = icon
+            return icon
+
+    # Final fallback
+    print("⚠️  Using fallback computer icon")
+    style = QApplication.style()
+    _FALLBACK_ICON = style.standardIcon(style.StandardPixmap.SP_ComputerIcon)
+    return _FALLBACK_ICON
+
+# Pre-rendered emoji button icons, keyed by emoji
+_EMOJI_ICON_CACHE: Dict[str, QIcon] = {}
+
+def emoji_icon(emoji: str) -> QIcon:
+    """Render an emoji to a cached icon so the emoji font is rasterized once, not on every repaint"""
+    icon = _EMOJI_ICON_CACHE.get(emoji)
+    if icon is None:
+        pixmap = QPixmap(24, 24)
+        pixmap.fill(Qt.GlobalColor.transparent)
+        painter = QPainter(pixmap)
+        font = painter.font()
+        font.setPixelSize(20)
+        painter.setFont(font)
+        painter.drawText(pixmap.rect(), Qt.AlignmentFlag.AlignCenter, emoji)
+        painter.end()
+        icon = QIcon(pixmap)
+        _EMOJI_ICON_CACHE[emoji] = icon
+    return icon
+
 # =============================================================================
 # MODERN TOGGLE SWITCH WIDGET
 # =============================================================================
@@ -406,18 +702,28 @@ class SegmentedControl(QWidget):
         layout.setContentsMargins(0, 0, 0, 0)
         layout.setSpacing(0)
 
+        # One group-level signal instead of a lambda per button
+        self.button_group = QButtonGroup(self)
+        self.button_group.idClicked.connect(self.select)
+
         for i, option in enumerate(options):
             btn = QPushButton(option)
             btn.setCheckable(True)
-            btn.clicked.connect(lambda checked, idx=i: self.select(idx))
             btn.setStyleSheet(self._get_button_style(i == 0))
+            self.button_group.addButton(btn, i)
             layout.addWidget(btn)
             self.buttons.append(btn)
 
         self.buttons[0].setChecked(True)
 
+    # Built once per state on first use; select() restyles every segment
+    _button_styles: Dict[bool, str] = {}
+
     def _get_button_style(self, is_selected):
-        base_style = f"""
+        cached = self._button_styles.get(is_selected)
+        if cached is not None:
+            return cached
+        base_style = minify_qss(f"""
             QPushButton {{
                 {'background-color: ' + COLORS_DARK['accent_blue'] + '; color: white;' if is_selected else 'background-color: ' + COLORS_DARK['bg_content'] + '; color: ' + COLORS_DARK['text_secondary'] + ';'}
                 border: none;
@@ -429,11 +735,15 @@ class SegmentedControl(QWidget):
             QPushButton:hover {{
                 background-color: {'#2563EB' if is_selected else COLORS_DARK['hover']};
             }}
-        """
+        """)
+        self._button_styles[is_selected] = base_style
         return base_style
 
+    @pyqtSlot(int)
     def select(self, index):
-        """Select a segment by index"""
+        """Select a segment by index (no restyle or signal if already selected)"""
+        if index == self.selected:
+            return
         self.selected = index
         for i, btn in enumerate(self.buttons):
             btn.setChecked(i == index)
@@ -456,75 +766,85 @@ class SegmentedControl(QWidget):
 class ScreensaverPreferencesV4(QMainWindow):
     """Modern screensaver preferences with 2025 aesthetic"""
 
+    # Combo box choices (shared by every instance, never rebuilt)
+    TYPE_ITEMS = ('Matrix', 'Mystify', 'Slideshow', 'Videos', 'None')
+    FPS_ITEMS = ('15', '30', '45', '60', '75', '90', '120', 'Unlimited')
+    DISPLAY_ITEMS = ('both', 'display0', 'display1')
+    MATRIX_COLOR_ITEMS = ('green', 'red', 'blue', 'cyan', 'magenta', 'yellow', 'white', 'rainbow')
+    MYSTIFY_COLOR_ITEMS = ('Rainbow', 'Single', 'Duo')
+    FIT_MODE_ITEMS = ('contain', 'cover', 'fill', 'scale-down')
+
+    # Item text -> index for each choice tuple above (used by create_combo)
+    COMBO_INDEX = {
+        items: {text: i for i, text in enumerate(items)}
+        for items in (TYPE_ITEMS, FPS_ITEMS, DISPLAY_ITEMS, MATRIX_COLOR_ITEMS, FIT_MODE_ITEMS)
+    }
+
+    # Mystify color mode combo index <-> settings value
+    MYSTIFY_COLOR_MODES = ('rainbow', 'single', 'duo')
+    MYSTIFY_COLOR_MODE_INDEX = {mode: i for i, mode in enumerate(MYSTIFY_COLOR_MODES)}
+
+    # Video playback speed slider positions 1-8 -> 0.25x-2.00x
+    VIDEO_SPEED_LABELS = tuple(f"{v / 4:.2f}x" for v in range(1, 9))
+
+    # External tools checked by run_diagnostics: (binary, description)
+    DIAGNOSTIC_BINARIES = (
+        ('wmctrl', 'Window management'),
+        ('xdotool', 'Window manipulation'),
+        ('swayidle', 'Wayland idle detection'),
+        ('lxterminal', 'Terminal emulator'),
+        ('x-terminal-emulator', 'Alternative terminal'),
+    )
+
+    # Power-off commands tried by on_shutdown_timeout, in order of preference
+    SHUTDOWN_COMMANDS = (
+        ('shutdown', '-h', 'now'),
+        ('systemctl', 'poweroff'),
+        ('poweroff',),
+    )
+
+    # settings.json flag for each screensaver type, in the order they are
+    # checked when several are set (sidekick_screensaver.sh reads these)
+    TYPE_MODE_KEYS = (
+        ('Matrix', 'matrix_mode'),
+        ('Slideshow', 'slideshow_mode'),
+        ('Mystify', 'mystify_mode'),
+        ('Videos', 'video_mode'),
+    )
+
+    # Settings page holding each screensaver type's options
+    TYPE_PAGE_INDEX = {'Matrix': 2, 'Mystify': 3, 'Slideshow': 4, 'Videos': 5}
+
+    # Widget module imported by each screensaver type's test launcher
+    TYPE_WIDGET_MODULE = {
+        'Matrix': 'sidekick_widget',
+        'Mystify': 'mystify_widget',
+        'Slideshow': 'slideshow_widget',
+        'Videos': 'video_widget',
+    }
+
     def __init__(self):
         super().__init__()
 
         # Version info
         self.app_version = "4.0.0"
-        self.build_date = datetime.datetime.now().strftime("%Y-%m-%d")
 
         # Instance checker
         self.instance_manager: Optional[SingleInstanceManager] = None
 
         # Configuration
-        self.config_dir = Path.home() / '.config' / 'screensaver'
-        self.config_file = self.config_dir / 'settings.json'
-        self.config_dir.mkdir(exist_ok=True)
-
-        # Default settings (same as original)
-        self.settings = {
-            'enabled': True,
-            'effect': 'matrix',
-            'matrix_mode': True,
-            'color': 'green',
-            'speed': 25,
-            'lock_timeout': 300,
-            'display_timeout': 600,
-            'rainbow_mode': False,
-            'bold_text': True,
-            'async_scroll': True,
-            'display_target': 'both',
-            'physical_only': True,
-            'start_on_boot': False,
-            'show_taskbar_icon': True,
-            'start_maximized': False,
-            'show_stats': False,
-            'target_fps': 15,
-            'auto_cpu_limit': False,
-            'use_katakana': True,
-            'font_size': 14,
-            'slideshow_mode': False,
-            'slideshow_folder': str(Path.home() / 'screensaver-media' / 'images'),
-            'slide_duration': 5.0,
-            'slideshow_random': True,
-            'slideshow_fit_mode': 'contain',
-            'mystify_mode': False,
-            'mystify_shapes': 3,
-            'mystify_trail_length': 50,
-            'mystify_complexity': 6,
-            'mystify_speed': 2,
-            'mystify_color_mode': 'rainbow',
-            'mystify_fill': False,
-            'mystify_color_hue': 240,
-            'mystify_color_hue1': 240,
-            'mystify_color_hue2': 60,
-            'dark_mode': True,
-            'auto_shutdown': False,
-            'shutdown_timeout': 60,
-            'auto_update_check': True,
-            'last_update_check': '',
-            'update_check_frequency': 30,
-            'update_notification': True,
-            'stats_drift': True,
-            'video_mode': False,
-            'video_folder': str(Path.home() / 'screensaver-media' / 'videos'),
-            'video_random': True,
-            'video_playback_speed': 1.0,
-            'video_mute': True,
-            'enable_touch_ui': False,  # Manual touch UI override
-            'display_shutdown': False,
-            'display_shutdown_timeout': 30,
-        }
+        self.config_dir = CONFIG_DIR
+        self.config_file = CONFIG_FILE
+        os.makedirs(self.config_dir, exist_ok=True)
+
+        # Last start-on-boot state written by setup_autostart (None = not yet this session)
+        self._autostart_enabled: Optional[bool] = None
+
+        # Screensaver window opened by the Test button, if any
+        self.test_window = None
+
+        # Start from the shared defaults, then overlay the saved settings
+        self.settings = dict(DEFAULT_SETTINGS)
 
         # Load saved settings
         self.load_settings()
@@ -548,12 +868,17 @@ class ScreensaverPreferencesV4(QMainWindow):
         self.setup_icons()
         self.create_ui()
         self.create_status_bar()
-        self.setup_system_tray()
 
-        # Timers
-        self.screensaver_timer = QTimer()
+        # Build the tray once the window has painted (talks to the compositor/SNI host),
+        # and only if it is enabled - apply_settings builds it if it is turned on later
+        self.tray_icon: Optional[QSystemTrayIcon] = None
+        if self.settings.get('show_taskbar_icon', True):
+            QTimer.singleShot(0, self.setup_system_tray)
+
+        # Idle timer - only runs while the GUI is hidden (see showEvent/hideEvent)
+        self.screensaver_timer = QTimer(self)
+        self.screensaver_timer.setTimerType(Qt.TimerType.VeryCoarseTimer)  # minutes-long, 1 s accuracy is plenty
         self.screensaver_timer.timeout.connect(self.on_screensaver_timeout)  # type: ignore
-        self.progress_timer = QTimer()
         self.last_activity_time = 0
         self.screensaver_active = False
         self.is_test_mode = False
@@ -565,85 +890,77 @@ class ScreensaverPreferencesV4(QMainWindow):
         # Check for updates on startup (non-blocking)
         QTimer.singleShot(2000, lambda: self.check_for_updates(manual=False))
 
-        # Shutdown timer
+        # Shutdown timers - created once, start_shutdown_timer/setup_display_shutdown only (re)arm them
+        self.shutdown_timer = QTimer(self)
+        self.shutdown_timer.setTimerType(Qt.TimerType.VeryCoarseTimer)
+        self.shutdown_timer.setSingleShot(True)
+        self.shutdown_timer.timeout.connect(self.on_shutdown_timeout)  # type: ignore
         if self.settings.get('auto_shutdown', False):
             self.start_shutdown_timer()
 
-        # Display shutdown timer
+        self.display_shutdown_timer = QTimer(self)
+        self.display_shutdown_timer.setTimerType(Qt.TimerType.VeryCoarseTimer)
+        self.display_shutdown_timer.setSingleShot(True)
+        self.display_shutdown_timer.timeout.connect(self.turn_off_displays)  # type: ignore
         if self.settings.get('display_shutdown', False):
             self.setup_display_shutdown()
 
     def setup_icons(self):
         """Setup window and tray icons using custom favicon"""
-        # Try to use custom favicon from media/Logo folder (development) or same directory (installed)
         dark_mode = self.settings.get('dark_mode', True)
 
-        # Use optimized 22x22 for system tray, 600x600 for window
-        favicon_22_filename = "SideKick_Logo_2025_Favicon_22.png" if dark_mode else "SideKick_Logo_2025_Favicon_light_22.png"
-        favicon_filename = "SideKick_Logo_2025_Favicon.png" if dark_mode else "SideKick_Logo_2025_Favicon_light.png"
-
-        # First try installed location (same directory as script)
-        favicon_22_path = Path(__file__).parent / favicon_22_filename
-        favicon_path = Path(__file__).parent / favicon_filename
+        # Icon resolution probes the filesystem and icon theme - only do it once per theme
+        cached_icon = _APP_ICON_CACHE.get(dark_mode)
+        if cached_icon is not None:
+            self.app_icon = cached_icon
+            self.setWindowIcon(cached_icon)
+            return
 
-        # If not found, try development location (media/Logo/)
-        if not favicon_22_path.exists():
-            favicon_22_path = Path(__file__).parent.parent / "media" / "Logo" / favicon_22_filename
-        if not favicon_path.exists():
-            favicon_path = Path(__file__).parent.parent / "media" / "Logo" / favicon_filename
+        self.app_icon = self._resolve_app_icon(dark_mode)
+        _APP_ICON_CACHE[dark_mode] = self.app_icon
+        self.setWindowIcon(self.app_icon)
 
-        # Create QIcon with multiple sizes for best rendering
-        if favicon_22_path.exists() and favicon_path.exists():
-            self.app_icon = QIcon()
-            self.app_icon.addFile(str(favicon_22_path), QSize(22, 22))  # System tray size
-            self.app_icon.addFile(str(favicon_path), QSize(600, 600))   # Window icon size
-            self.setWindowIcon(self.app_icon)
-            print(f"✅ Using custom favicon with optimized sizes (22x22 for tray, 600x600 for window)")
-            return
-        elif favicon_path.exists():
-            # Fallback to single size if 22x22 not available
-            self.app_icon = QIcon(str(favicon_path))
-            self.setWindowIcon(self.app_icon)
-            print(f"✅ Using custom favicon: {favicon_filename}")
-            return
+    def _resolve_app_icon(self, dark_mode: bool) -> QIcon:
+        """Find the best available app icon (custom favicon, theme icon, or fallback)"""
+        # Use optimized 22x22 for system tray, 600x600 for window
+        favicon_22_filename, favicon_filename = _FAVICON_FILES[dark_mode]
 
-        # Fallback to system theme icons
-        icon_names = [
-            "preferences-desktop-screensaver",
-            "xscreensaver",
-            "screensaver",
-            "preferences-desktop",
-            "video-display"
-        ]
+        # First try installed location (same directory as script), then development location (media/Logo/)
+        favicon_22_path = os.path.join(_SCRIPT_DIR, favicon_22_filename)
+        favicon_path = os.path.join(_SCRIPT_DIR, favicon_filename)
+        if not os.path.exists(favicon_22_path):
+            favicon_22_path = os.path.join(_DEV_LOGO_DIR, favicon_22_filename)
+        if not os.path.exists(favicon_path):
+            favicon_path = os.path.join(_DEV_LOGO_DIR, favicon_filename)
 
-        for icon_name in icon_names:
-            icon = QIcon.fromTheme(icon_name)
-            if not icon.isNull():
-                self.app_icon = icon
-                self.setWindowIcon(icon)
-                print(f"✅ Using icon: {icon_name}")
-                return
+        # Create QIcon with multiple sizes for best rendering
+        if os.path.exists(favicon_path):
+            if os.path.exists(favicon_22_path):
+                icon = QIcon()
+                icon.addFile(favicon_22_path, QSize(22, 22))  # System tray size
+                icon.addFile(favicon_path, QSize(600, 600))   # Window icon size
+                print(f"✅ Using custom favicon with optimized sizes (22x22 for tray, 600x600 for window)")
+            else:
+                # Fallback to single size if 22x22 not available
+                icon = QIcon(favicon_path)
+                print(f"✅ Using custom favicon: {favicon_filename}")
+            return icon
 
-        # Final fallback
-        print("⚠️  Using fallback computer icon")
-        self.app_icon = self.style().standardIcon(self.style().StandardPixmap.SP_ComputerIcon)
-        self.setWindowIcon(self.app_icon)
+        return fallback_app_icon()
 
     def load_settings(self):
         """Load settings from JSON"""
-        if self.config_file.exists():
-            try:
-                with open(self.config_file, 'r', encoding='utf-8') as f:
-                    saved = json.load(f)
-                    self.settings.update(saved)
-            except Exception as e:
-                print(f"Error loading settings: {e}")
+        try:
+            self.settings.update(read_settings_file(self.config_file))
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            print(f"Error loading settings: {e}")
 
     def save_settings(self) -> bool:
         """Save settings to JSON"""
         try:
-            with open(self.config_file, 'w', encoding='utf-8') as f:
-                json.dump(self.settings, f, indent=2)
+            write_settings_file(self.config_file, self.settings)
             return True
         except Exception as e:
             msg = self.create_styled_messagebox("Error", f"Failed to save: {e}", QMessageBox.Icon.Critical)
@@ -652,6 +969,8 @@ class ScreensaverPreferencesV4(QMainWindow):
 
     def create_ui(self):
         """Create the main UI with sidebar navigation"""
+        # No repaints while the widget tree is assembled
+        self.setUpdatesEnabled(False)
         central = QWidget()
         self.setCentralWidget(central)
         main_layout = QVBoxLayout(central)  # Changed to VBoxLayout to stack content and footer
@@ -668,15 +987,39 @@ class ScreensaverPreferencesV4(QMainWindow):
         sidebar = self.create_sidebar()
         top_layout.addWidget(sidebar)
 
-        # Content area
+        # Content area - only the General page is built up front, the other
+        # pages start as placeholders and are built on first display (or
+        # when a test needs their widgets)
         self.content_stack = QStackedWidget()
         self.content_stack.setObjectName("contentArea")
-        self.content_stack.addWidget(self.create_general_page())
-        self.content_stack.addWidget(self.create_display_page())
-        self.content_stack.addWidget(self.create_matrix_page())
-        self.content_stack.addWidget(self.create_mystify_page())
-        self.content_stack.addWidget(self.create_slideshow_page())
-        self.content_stack.addWidget(self.create_video_page())
+        self._page_builders = (
+            self.create_general_page,
+            self.create_display_page,
+            self.create_matrix_page,
+            self.create_mystify_page,
+            self.create_slideshow_page,
+            self.create_video_page,
+        )
+        # Widget readers per page, in the same order as _page_builders
+        self._page_collectors = (
+            self._collect_general_settings,
+            self._collect_display_settings,
+            self._collect_matrix_settings,
+            self._collect_mystify_settings,
+            self._collect_slideshow_settings,
+            self._collect_video_settings,
+        )
+        self._built_pages = set()
+        # Test launcher per screensaver type (keys match TYPE_PAGE_INDEX)
+        self._test_launchers = {
+            'Matrix': self.test_matrix,
+            'Mystify': self.test_mystify,
+            'Slideshow': self.test_slideshow,
+            'Videos': self.test_videos,
+        }
+        for _ in self._page_builders:
+            self.content_stack.addWidget(QWidget())
+        self.ensure_page(0)
 
         top_layout.addWidget(self.content_stack)
 
@@ -690,6 +1033,23 @@ class ScreensaverPreferencesV4(QMainWindow):
         footer_layout.setContentsMargins(48, 16, 48, 16)
         footer_layout.addLayout(self.create_footer())
         main_layout.addWidget(footer_container)
+        self.setUpdatesEnabled(True)
+
+    def ensure_page(self, index: int) -> None:
+        """Build a settings page the first time it is needed"""
+        if index in self._built_pages:
+            return
+        self._built_pages.add(index)
+
+        placeholder = self.content_stack.widget(index)
+        is_current = self.content_stack.currentIndex() == index
+        self.content_stack.setUpdatesEnabled(False)
+        self.content_stack.removeWidget(placeholder)
+        placeholder.deleteLater()
+        self.content_stack.insertWidget(index, self._page_builders[index]())
+        if is_current:
+            self.content_stack.setCurrentIndex(index)
+        self.content_stack.setUpdatesEnabled(True)
 
     def create_sidebar(self) -> QFrame:
         """Create navigation sidebar"""
@@ -713,20 +1073,24 @@ class ScreensaverPreferencesV4(QMainWindow):
 
         # Navigation
         nav_items = [
-            ("⚙️  General", 0),
-            ("🖥️  Display & Performance", 1),
-            ("🎬  Matrix Settings", 2),
-            ("🌈  Mystify Settings", 3),
-            ("🖼️  Slideshow Settings", 4),
-            ("📹  Video Settings", 5),
+            ("⚙️", "General", 0),
+            ("🖥️", "Display & Performance", 1),
+            ("🎬", "Matrix Settings", 2),
+            ("🌈", "Mystify Settings", 3),
+            ("🖼️", "Slideshow Settings", 4),
+            ("📹", "Video Settings", 5),
         ]
 
+        # One group-level signal instead of a lambda per button
+        self.nav_group = QButtonGroup(sidebar)
+        self.nav_group.idClicked.connect(self.switch_page)
+
         self.nav_buttons = []
-        for text, index in nav_items:
-            btn = QPushButton(text)
+        for emoji, text, index in nav_items:
+            btn = QPushButton(emoji_icon(emoji), text)
             btn.setObjectName("navButton")
             btn.setCursor(Qt.CursorShape.PointingHandCursor)
-            btn.clicked.connect(lambda checked, idx=index: self.switch_page(idx))
+            self.nav_group.addButton(btn, index)
             layout.addWidget(btn)
             self.nav_buttons.append(btn)
 
@@ -769,8 +1133,10 @@ class ScreensaverPreferencesV4(QMainWindow):
 
         return sidebar
 
+    @pyqtSlot(int)
     def switch_page(self, index):
         """Switch pages and update nav buttons"""
+        self.ensure_page(index)
         self.content_stack.setCurrentIndex(index)
         for i, btn in enumerate(self.nav_buttons):
             btn.setProperty("active", "true" if i == index else "false")
@@ -779,6 +1145,7 @@ class ScreensaverPreferencesV4(QMainWindow):
 
     def create_general_page(self) -> QWidget:
         """Create General settings page"""
+        setting = self.settings.get  # bound once for the many lookups below
         page = QWidget()
         layout = QVBoxLayout(page)
         layout.setContentsMargins(48, 40, 48, 40)
@@ -794,21 +1161,21 @@ class ScreensaverPreferencesV4(QMainWindow):
         behavior_label.setObjectName("sectionLabel")
         layout.addWidget(behavior_label)
 
-        self.boot_toggle = self.create_toggle_row("Start on Boot", self.settings.get('start_on_boot', False))
+        self.boot_toggle = self.create_toggle_row("Start on Boot", setting('start_on_boot', False))
         layout.addLayout(self.boot_toggle[0])
         layout.addSpacing(12)
 
-        self.taskbar_toggle = self.create_toggle_row("Show Taskbar Icon", self.settings.get('show_taskbar_icon', True))
+        self.taskbar_toggle = self.create_toggle_row("Show Taskbar Icon", setting('show_taskbar_icon', True))
         layout.addLayout(self.taskbar_toggle[0])
 
         layout.addSpacing(12)
 
-        self.maximized_toggle = self.create_toggle_row("Start GUI Maximized", self.settings.get('start_maximized', False))
+        self.maximized_toggle = self.create_toggle_row("Start GUI Maximized", setting('start_maximized', False))
         layout.addLayout(self.maximized_toggle[0])
 
         layout.addSpacing(12)
 
-        self.touch_ui_toggle = self.create_toggle_row("Enable Touch UI Mode", self.settings.get('enable_touch_ui', False))
+        self.touch_ui_toggle = self.create_toggle_row("Enable Touch UI Mode", setting('enable_touch_ui', False))
         layout.addLayout(self.touch_ui_toggle[0])
 
         # Appearance Section
@@ -821,7 +1188,7 @@ class ScreensaverPreferencesV4(QMainWindow):
         theme_row.addSpacing(20)
 
         self.theme_control = SegmentedControl(["Dark", "Light"])
-        current_theme_index = 0 if self.settings.get('dark_mode', True) else 1
+        current_theme_index = 0 if setting('dark_mode', True) else 1
         self.theme_control.setCurrentIndex(current_theme_index)
         self.theme_control.selectionChanged.connect(self.on_theme_changed)
         theme_row.addWidget(self.theme_control)
@@ -833,19 +1200,12 @@ class ScreensaverPreferencesV4(QMainWindow):
 
         type_row = QHBoxLayout()
         type_row.addWidget(QLabel("Type:"))
-        self.type_combo = QComboBox()
-        self.type_combo.addItems(['Matrix', 'Mystify', 'Slideshow', 'Videos', 'None'])
-
-        if not self.settings.get('enabled', True):
-            self.type_combo.setCurrentText('None')
-        elif self.settings.get('matrix_mode', True):
-            self.type_combo.setCurrentText('Matrix')
-        elif self.settings.get('slideshow_mode', False):
-            self.type_combo.setCurrentText('Slideshow')
-        elif self.settings.get('mystify_mode', False):
-            self.type_combo.setCurrentText('Mystify')
-        elif self.settings.get('video_mode', False):
-            self.type_combo.setCurrentText('Videos')
+        if not setting('enabled', True):
+            current_type = 'None'
+        else:
+            current_type = next((type_name for type_name, key in self.TYPE_MODE_KEYS
+                                 if setting(key, type_name == 'Matrix')), 'Matrix')
+        self.type_combo = self.create_combo(self.TYPE_ITEMS, current_type)
 
         self.type_combo.currentTextChanged.connect(self.on_type_changed)
         type_row.addWidget(self.type_combo)
@@ -857,19 +1217,19 @@ class ScreensaverPreferencesV4(QMainWindow):
 
         self.screensaver_slider = self.create_slider_row(
             "Start screensaver after:",
-            self.settings['lock_timeout'] // 60, 1, 60, "min"
+            setting('lock_timeout', 300) // 60, 1, 60, "min"
         )
         layout.addLayout(self.screensaver_slider[0])
         layout.addSpacing(20)
 
         # Auto-shutdown toggle
-        self.auto_shutdown_toggle = self.create_toggle_row("Enable Auto-Shutdown", self.settings.get('auto_shutdown', False))
+        self.auto_shutdown_toggle = self.create_toggle_row("Enable Auto-Shutdown", setting('auto_shutdown', False))
         layout.addLayout(self.auto_shutdown_toggle[0])
         layout.addSpacing(12)
 
         self.shutdown_row = self.create_slider_row(
             "Auto-shutdown after:",
-            self.settings.get('shutdown_timeout', 60), 5, 480, "min"
+            setting('shutdown_timeout', 60), 5, 480, "min"
         )
         layout.addLayout(self.shutdown_row[0])
 
@@ -882,19 +1242,19 @@ class ScreensaverPreferencesV4(QMainWindow):
         update_label.setObjectName("sectionLabel")
         layout.addWidget(update_label)
 
-        self.auto_update_toggle = self.create_toggle_row("Check for Updates Automatically", self.settings.get('auto_update_check', True))
+        self.auto_update_toggle = self.create_toggle_row("Check for Updates Automatically", setting('auto_update_check', True))
         layout.addLayout(self.auto_update_toggle[0])
 
         layout.addSpacing(12)
 
-        self.update_notification_toggle = self.create_toggle_row("Show Update Notifications", self.settings.get('update_notification', True))
+        self.update_notification_toggle = self.create_toggle_row("Show Update Notifications", setting('update_notification', True))
         layout.addLayout(self.update_notification_toggle[0])
 
         layout.addSpacing(12)
 
         self.update_frequency_slider = self.create_slider_row(
             "Check frequency:",
-            self.settings.get('update_check_frequency', 30), 1, 90, "days"
+            setting('update_check_frequency', 30), 1, 90, "days"
         )
         layout.addLayout(self.update_frequency_slider[0])
 
@@ -904,6 +1264,7 @@ class ScreensaverPreferencesV4(QMainWindow):
 
     def create_display_page(self) -> QWidget:
         """Create Display & Performance page"""
+        setting = self.settings.get
         page = QWidget()
         layout = QVBoxLayout(page)
         layout.setContentsMargins(48, 40, 48, 40)
@@ -919,17 +1280,15 @@ class ScreensaverPreferencesV4(QMainWindow):
 
         fps_row = QHBoxLayout()
         fps_row.addWidget(QLabel("Target FPS:"))
-        self.fps_combo = QComboBox()
-        self.fps_combo.addItems(['15', '30', '45', '60', '75', '90', '120', 'Unlimited'])
-        current_fps = self.settings.get('target_fps', 15)
-        self.fps_combo.setCurrentText('Unlimited' if current_fps == 0 else str(current_fps))
+        current_fps = setting('target_fps', 15)
+        self.fps_combo = self.create_combo(self.FPS_ITEMS, 'Unlimited' if current_fps == 0 else str(current_fps))
         fps_row.addWidget(self.fps_combo)
         fps_row.addStretch()
         layout.addLayout(fps_row)
 
         layout.addSpacing(12)
 
-        self.cpu_toggle = self.create_toggle_row("FPS Throttling", self.settings.get('auto_cpu_limit', False))
+        self.cpu_toggle = self.create_toggle_row("FPS Throttling", setting('auto_cpu_limit', False))
         layout.addLayout(self.cpu_toggle[0])
 
         # Display Settings
@@ -939,21 +1298,19 @@ class ScreensaverPreferencesV4(QMainWindow):
 
         target_row = QHBoxLayout()
         target_row.addWidget(QLabel("Display Target:"))
-        self.display_combo = QComboBox()
-        self.display_combo.addItems(['both', 'display0', 'display1'])
-        self.display_combo.setCurrentText(self.settings.get('display_target', 'both'))
+        self.display_combo = self.create_combo(self.DISPLAY_ITEMS, setting('display_target', 'both'))
         target_row.addWidget(self.display_combo)
         target_row.addStretch()
         layout.addLayout(target_row)
 
         layout.addSpacing(12)
 
-        self.physical_toggle = self.create_toggle_row("Physical screens only", self.settings.get('physical_only', True))
+        self.physical_toggle = self.create_toggle_row("Physical screens only", setting('physical_only', True))
         layout.addLayout(self.physical_toggle[0])
 
         layout.addSpacing(12)
 
-        self.stats_toggle = self.create_toggle_row("Show Stats Overlay", self.settings.get('show_stats', False))
+        self.stats_toggle = self.create_toggle_row("Show Stats Overlay", setting('show_stats', False))
         layout.addLayout(self.stats_toggle[0])
 
         # Note about stats compatibility
@@ -966,13 +1323,13 @@ class ScreensaverPreferencesV4(QMainWindow):
         power_label.setObjectName("sectionLabel")
         layout.addWidget(power_label)
 
-        self.display_shutdown_toggle = self.create_toggle_row("Enable Display Shutdown", self.settings.get('display_shutdown', False))
+        self.display_shutdown_toggle = self.create_toggle_row("Enable Display Shutdown", setting('display_shutdown', False))
         layout.addLayout(self.display_shutdown_toggle[0])
         layout.addSpacing(12)
 
         self.display_shutdown_slider = self.create_slider_row(
             "Shutdown display after:",
-            self.settings.get('display_shutdown_timeout', 30), 5, 120, "min"
+            setting('display_shutdown_timeout', 30), 5, 120, "min"
         )
         layout.addLayout(self.display_shutdown_slider[0])
 
@@ -985,6 +1342,7 @@ class ScreensaverPreferencesV4(QMainWindow):
 
     def create_matrix_page(self) -> QWidget:
         """Create Matrix screensaver settings page"""
+        setting = self.settings.get
         page = QWidget()
         layout = QVBoxLayout(page)
         layout.setContentsMargins(48, 40, 48, 40)
@@ -1000,10 +1358,8 @@ class ScreensaverPreferencesV4(QMainWindow):
 
         color_row = QHBoxLayout()
         color_row.addWidget(QLabel("Color:"))
-        self.color_combo = QComboBox()
-        self.color_combo.addItems(['green', 'red', 'blue', 'cyan', 'magenta', 'yellow', 'white', 'rainbow'])
-        color = 'rainbow' if self.settings.get('rainbow_mode', False) else self.settings.get('color', 'green')
-        self.color_combo.setCurrentText(color)
+        color = 'rainbow' if setting('rainbow_mode', False) else setting('color', 'green')
+        self.color_combo = self.create_combo(self.MATRIX_COLOR_ITEMS, color)
         color_row.addWidget(self.color_combo)
         color_row.addStretch()
         layout.addLayout(color_row)
@@ -1015,7 +1371,7 @@ class ScreensaverPreferencesV4(QMainWindow):
 
         self.speed_slider = self.create_slider_row(
             "Speed:",
-            self.settings.get('speed', 25), 0, 50, ""
+            setting('speed', 25), 0, 50, ""
         )
         layout.addLayout(self.speed_slider[0])
 
@@ -1024,19 +1380,19 @@ class ScreensaverPreferencesV4(QMainWindow):
         char_label.setObjectName("sectionLabel")
         layout.addWidget(char_label)
 
-        self.katakana_toggle = self.create_toggle_row("Use Japanese Katakana", self.settings.get('use_katakana', True))
+        self.katakana_toggle = self.create_toggle_row("Use Japanese Katakana", setting('use_katakana', True))
         layout.addLayout(self.katakana_toggle[0])
 
         layout.addSpacing(12)
 
-        self.bold_toggle = self.create_toggle_row("Bold Characters", self.settings.get('bold_text', True))
+        self.bold_toggle = self.create_toggle_row("Bold Characters", setting('bold_text', True))
         layout.addLayout(self.bold_toggle[0])
 
         layout.addSpacing(12)
 
         self.font_size_slider = self.create_slider_row(
             "Font Size:",
-            self.settings.get('font_size', 14), 10, 20, "px"
+            setting('font_size', 14), 10, 20, "px"
         )
         layout.addLayout(self.font_size_slider[0])
 
@@ -1045,6 +1401,7 @@ class ScreensaverPreferencesV4(QMainWindow):
 
     def create_mystify_page(self) -> QWidget:
         """Create Mystify screensaver settings page"""
+        setting = self.settings.get
         page = QWidget()
         layout = QVBoxLayout(page)
         layout.setContentsMargins(48, 40, 48, 40)
@@ -1062,7 +1419,7 @@ class ScreensaverPreferencesV4(QMainWindow):
         shapes_row.addWidget(QLabel("Number of Shapes:"))
         self.shapes_spin = QSpinBox()
         self.shapes_spin.setRange(1, 8)
-        self.shapes_spin.setValue(self.settings.get('mystify_shapes', 3))
+        self.shapes_spin.setValue(setting('mystify_shapes', 3))
         shapes_row.addWidget(self.shapes_spin)
         shapes_row.addStretch()
         layout.addLayout(shapes_row)
@@ -1073,7 +1430,7 @@ class ScreensaverPreferencesV4(QMainWindow):
         complexity_row.addWidget(QLabel("Complexity (Vertices):"))
         self.complexity_spin = QSpinBox()
         self.complexity_spin.setRange(3, 12)
-        self.complexity_spin.setValue(self.settings.get('mystify_complexity', 6))
+        self.complexity_spin.setValue(setting('mystify_complexity', 6))
         complexity_row.addWidget(self.complexity_spin)
         complexity_row.addStretch()
         layout.addLayout(complexity_row)
@@ -1087,7 +1444,7 @@ class ScreensaverPreferencesV4(QMainWindow):
         speed_row.addWidget(QLabel("Speed:"))
         self.mystify_speed_spin = QSpinBox()
         self.mystify_speed_spin.setRange(1, 10)
-        self.mystify_speed_spin.setValue(self.settings.get('mystify_speed', 2))
+        self.mystify_speed_spin.setValue(setting('mystify_speed', 2))
         speed_row.addWidget(self.mystify_speed_spin)
         speed_row.addStretch()
         layout.addLayout(speed_row)
@@ -1098,7 +1455,7 @@ class ScreensaverPreferencesV4(QMainWindow):
         trail_row.addWidget(QLabel("Trail Length:"))
         self.trail_spin = QSpinBox()
         self.trail_spin.setRange(10, 100)
-        self.trail_spin.setValue(self.settings.get('mystify_trail_length', 50))
+        self.trail_spin.setValue(setting('mystify_trail_length', 50))
         trail_row.addWidget(self.trail_spin)
         trail_row.addStretch()
         layout.addLayout(trail_row)
@@ -1108,7 +1465,7 @@ class ScreensaverPreferencesV4(QMainWindow):
         render_label.setObjectName("sectionLabel")
         layout.addWidget(render_label)
 
-        self.fill_toggle = self.create_toggle_row("Fill Shapes", self.settings.get('mystify_fill', False))
+        self.fill_toggle = self.create_toggle_row("Fill Shapes", setting('mystify_fill', False))
         layout.addLayout(self.fill_toggle[0])
 
         # Color Settings
@@ -1119,9 +1476,9 @@ class ScreensaverPreferencesV4(QMainWindow):
         color_mode_row = QHBoxLayout()
         color_mode_row.addWidget(QLabel("Color Mode:"))
         self.mystify_color_combo = QComboBox()
-        self.mystify_color_combo.addItems(['Rainbow', 'Single', 'Duo'])
-        current_mode = self.settings.get('mystify_color_mode', 'rainbow')
-        mode_index = {'rainbow': 0, 'single': 1, 'duo': 2}.get(current_mode, 0)
+        self.mystify_color_combo.addItems(self.MYSTIFY_COLOR_ITEMS)
+        current_mode = setting('mystify_color_mode', 'rainbow')
+        mode_index = self.MYSTIFY_COLOR_MODE_INDEX.get(current_mode, 0)
         self.mystify_color_combo.setCurrentIndex(mode_index)
         self.mystify_color_combo.currentIndexChanged.connect(self.on_mystify_color_mode_changed)
         color_mode_row.addWidget(self.mystify_color_combo)
@@ -1130,29 +1487,37 @@ class ScreensaverPreferencesV4(QMainWindow):
 
         layout.addSpacing(12)
 
-        # Single color hue slider
+        # Single color hue slider (in its own panel so the mode switch hides one widget)
+        self.mystify_single_hue_panel = QWidget()
+        single_layout = QVBoxLayout(self.mystify_single_hue_panel)
+        single_layout.setContentsMargins(0, 0, 0, 0)
         self.mystify_hue_slider = self.create_slider_row(
             "Single Color Hue:",
-            self.settings.get('mystify_color_hue', 240), 0, 360, "°"
+            setting('mystify_color_hue', 240), 0, 360, "°"
         )
-        layout.addLayout(self.mystify_hue_slider[0])
+        single_layout.addLayout(self.mystify_hue_slider[0])
+        layout.addWidget(self.mystify_single_hue_panel)
 
         layout.addSpacing(12)
 
         # Duo color hue sliders
+        self.mystify_duo_hue_panel = QWidget()
+        duo_layout = QVBoxLayout(self.mystify_duo_hue_panel)
+        duo_layout.setContentsMargins(0, 0, 0, 0)
         self.mystify_hue1_slider = self.create_slider_row(
             "Duo Color 1 Hue:",
-            self.settings.get('mystify_color_hue1', 240), 0, 360, "°"
+            setting('mystify_color_hue1', 240), 0, 360, "°"
         )
-        layout.addLayout(self.mystify_hue1_slider[0])
+        duo_layout.addLayout(self.mystify_hue1_slider[0])
 
-        layout.addSpacing(12)
+        duo_layout.addSpacing(12)
 
         self.mystify_hue2_slider = self.create_slider_row(
             "Duo Color 2 Hue:",
-            self.settings.get('mystify_color_hue2', 60), 0, 360, "°"
+            setting('mystify_color_hue2', 60), 0, 360, "°"
         )
-        layout.addLayout(self.mystify_hue2_slider[0])
+        duo_layout.addLayout(self.mystify_hue2_slider[0])
+        layout.addWidget(self.mystify_duo_hue_panel)
 
         # Initially show/hide color sliders based on mode
         self.on_mystify_color_mode_changed(mode_index)
@@ -1162,6 +1527,7 @@ class ScreensaverPreferencesV4(QMainWindow):
 
     def create_slideshow_page(self) -> QWidget:
         """Create Slideshow settings page"""
+        setting = self.settings.get
         page = QWidget()
         layout = QVBoxLayout(page)
         layout.setContentsMargins(48, 40, 48, 40)
@@ -1177,14 +1543,14 @@ class ScreensaverPreferencesV4(QMainWindow):
 
         folder_row = QHBoxLayout()
         folder_row.addWidget(QLabel("Image Folder:"))
-        self.folder_button = QPushButton("📁 Browse...")
+        self.folder_button = QPushButton(emoji_icon("📁"), "Browse...")
         self.folder_button.setObjectName("secondaryButton")
         self.folder_button.clicked.connect(self.browse_folder)
         folder_row.addWidget(self.folder_button)
 
         # Display current folder path
         self.slideshow_folder_label = QLabel()
-        current_folder = self.settings.get('slideshow_folder', '')
+        current_folder = setting('slideshow_folder', '')
         if current_folder:
             self.slideshow_folder_label.setText(f"📂 {current_folder}")
         else:
@@ -1204,7 +1570,7 @@ class ScreensaverPreferencesV4(QMainWindow):
         duration_row.addWidget(QLabel("Slide Duration (seconds):"))
         self.duration_spin = QDoubleSpinBox()
         self.duration_spin.setRange(1.0, 60.0)
-        self.duration_spin.setValue(self.settings.get('slide_duration', 5.0))
+        self.duration_spin.setValue(setting('slide_duration', 5.0))
         duration_row.addWidget(self.duration_spin)
         duration_row.addStretch()
         layout.addLayout(duration_row)
@@ -1214,16 +1580,14 @@ class ScreensaverPreferencesV4(QMainWindow):
         playback_label.setObjectName("sectionLabel")
         layout.addWidget(playback_label)
 
-        self.slideshow_random_toggle = self.create_toggle_row("Randomize Order", self.settings.get('slideshow_random', True))
+        self.slideshow_random_toggle = self.create_toggle_row("Randomize Order", setting('slideshow_random', True))
         layout.addLayout(self.slideshow_random_toggle[0])
 
         layout.addSpacing(12)
 
         fit_row = QHBoxLayout()
         fit_row.addWidget(QLabel("Fit Mode:"))
-        self.fit_combo = QComboBox()
-        self.fit_combo.addItems(['contain', 'cover', 'fill', 'scale-down'])
-        self.fit_combo.setCurrentText(self.settings.get('slideshow_fit_mode', 'contain'))
+        self.fit_combo = self.create_combo(self.FIT_MODE_ITEMS, setting('slideshow_fit_mode', 'contain'))
         fit_row.addWidget(self.fit_combo)
         fit_row.addStretch()
         layout.addLayout(fit_row)
@@ -1233,6 +1597,7 @@ class ScreensaverPreferencesV4(QMainWindow):
 
     def create_video_page(self) -> QWidget:
         """Create Video player settings page"""
+        setting = self.settings.get
         page = QWidget()
         layout = QVBoxLayout(page)
         layout.setContentsMargins(48, 40, 48, 40)
@@ -1248,14 +1613,14 @@ class ScreensaverPreferencesV4(QMainWindow):
 
         video_folder_row = QHBoxLayout()
         video_folder_row.addWidget(QLabel("Video Folder:"))
-        self.video_folder_button = QPushButton("📁 Browse...")
+        self.video_folder_button = QPushButton(emoji_icon("📁"), "Browse...")
         self.video_folder_button.setObjectName("secondaryButton")
         self.video_folder_button.clicked.connect(self.browse_video_folder)
         video_folder_row.addWidget(self.video_folder_button)
 
         # Display current folder path
         self.video_folder_label = QLabel()
-        current_folder = self.settings.get('video_folder', '')
+        current_folder = setting('video_folder', '')
         if current_folder:
             self.video_folder_label.setText(f"📂 {current_folder}")
         else:
@@ -1271,127 +1636,33 @@ class ScreensaverPreferencesV4(QMainWindow):
         playback_label.setObjectName("sectionLabel")
         layout.addWidget(playback_label)
 
-        self.video_random_toggle = self.create_toggle_row("Randomize Video Order", self.settings.get('video_random', True))
+        self.video_random_toggle = self.create_toggle_row("Randomize Video Order", setting('video_random', True))
         layout.addLayout(self.video_random_toggle[0])
 
         layout.addSpacing(12)
 
-        self.video_mute_toggle = self.create_toggle_row("Mute Video Audio", self.settings.get('video_mute', True))
+        self.video_mute_toggle = self.create_toggle_row("Mute Video Audio", setting('video_mute', True))
         layout.addLayout(self.video_mute_toggle[0])
 
         layout.addSpacing(12)
 
         # Playback speed slider (0.25x to 2.0x, step 0.25)
-        speed_value = int(self.settings.get('video_playback_speed', 1.0) * 4)  # Convert to 1-8 range
+        speed_value = int(setting('video_playback_speed', 1.0) * 4)  # Convert to 1-8 range
         self.video_speed_slider = self.create_slider_row(
             "Playback Speed:",
-            speed_value, 1, 8, "x"
+            speed_value, 1, 8, "x", self.VIDEO_SPEED_LABELS
         )
-        # Custom value label formatting for speed
-        speed_slider = self.video_speed_slider[1]
-        speed_label = self.video_speed_slider[2]
-        speed_label.setText(f"{speed_value/4:.2f}x")
-        speed_slider.valueChanged.connect(lambda v: speed_label.setText(f"{v/4:.2f}x"))
         layout.addLayout(self.video_speed_slider[0])
 
         layout.addStretch()
         return page
-        """Create Source (Videos) page"""
-        page = QWidget()
-        layout = QVBoxLayout(page)
-        layout.setContentsMargins(48, 40, 48, 40)
-
-        header = QLabel("◀️ Source Settings")
-        header.setObjectName("sectionHeader")
-        layout.addWidget(header)
-
-        # Matrix Settings
-        matrix_label = QLabel("Matrix Settings")
-        matrix_label.setObjectName("sectionLabel")
-        layout.addWidget(matrix_label)
-
-        color_row = QHBoxLayout()
-        color_row.addWidget(QLabel("Color:"))
-        self.color_combo = QComboBox()
-        self.color_combo.addItems(['green', 'red', 'blue', 'cyan', 'magenta', 'yellow', 'white', 'rainbow'])
-        color = 'rainbow' if self.settings.get('rainbow_mode', False) else self.settings.get('color', 'green')
-        self.color_combo.setCurrentText(color)
-        color_row.addWidget(self.color_combo)
-        color_row.addStretch()
-        layout.addLayout(color_row)
-
-        layout.addSpacing(20)
-
-        self.speed_slider = self.create_slider_row(
-            "Speed:",
-            self.settings.get('speed', 25), 0, 50, ""
-        )
-        layout.addLayout(self.speed_slider[0])
-
-        layout.addSpacing(20)
-
-        self.katakana_toggle = self.create_toggle_row("Use Japanese Katakana", self.settings.get('use_katakana', True))
-        layout.addLayout(self.katakana_toggle[0])
-
-        layout.addSpacing(12)
-
-        self.bold_toggle = self.create_toggle_row("Bold Characters", self.settings.get('bold_text', True))
-        layout.addLayout(self.bold_toggle[0])
-
-        # Slideshow Settings
-        slideshow_label = QLabel("Slideshow Settings")
-        slideshow_label.setObjectName("sectionLabel")
-        layout.addWidget(slideshow_label)
-
-        folder_row = QHBoxLayout()
-        folder_row.addWidget(QLabel("Folder:"))
-        self.folder_button = QPushButton("📁 Browse...")
-        self.folder_button.setObjectName("secondaryButton")
-        self.folder_button.clicked.connect(self.browse_folder)
-        folder_row.addWidget(self.folder_button)
-        folder_row.addStretch()
-        layout.addLayout(folder_row)
 
-        # Mystify Settings
-        mystify_label = QLabel("Mystify Settings")
-        mystify_label.setObjectName("sectionLabel")
-        layout.addWidget(mystify_label)
-
-        shapes_row = QHBoxLayout()
-        shapes_row.addWidget(QLabel("Shapes:"))
-        self.shapes_spin = QSpinBox()
-        self.shapes_spin.setRange(1, 8)
-        self.shapes_spin.setValue(self.settings.get('mystify_shapes', 3))
-        shapes_row.addWidget(self.shapes_spin)
-        shapes_row.addStretch()
-        layout.addLayout(shapes_row)
-
-        # Video Settings
-        video_label = QLabel("Video Player Settings")
-        video_label.setObjectName("sectionLabel")
-        layout.addWidget(video_label)
-
-        video_folder_row = QHBoxLayout()
-        video_folder_row.addWidget(QLabel("Video Folder:"))
-        self.video_folder_button = QPushButton("📁 Browse...")
-        self.video_folder_button.setObjectName("secondaryButton")
-        self.video_folder_button.clicked.connect(self.browse_video_folder)
-        video_folder_row.addWidget(self.video_folder_button)
-        video_folder_row.addStretch()
-        layout.addLayout(video_folder_row)
-
-        layout.addSpacing(12)
-
-        self.video_random_toggle = self.create_toggle_row("Randomize Video Order", self.settings.get('video_random', True))
-        layout.addLayout(self.video_random_toggle[0])
-
-        layout.addSpacing(12)
-
-        self.video_mute_toggle = self.create_toggle_row("Mute Video Audio", self.settings.get('video_mute', True))
-        layout.addLayout(self.video_mute_toggle[0])
-
-        layout.addStretch()
-        return page
+    def create_combo(self, items: Tuple[str, ...], current: str) -> QComboBox:
+        """Create combo box with items, selecting current by index (first item if unknown)"""
+        combo = QComboBox()
+        combo.addItems(items)
+        combo.setCurrentIndex(self.COMBO_INDEX[items].get(current, 0))
+        return combo
 
     def create_toggle_row(self, label_text: str, checked: bool = False) -> tuple[QHBoxLayout, ModernToggleSwitch]:
         """Create row with label and toggle"""
@@ -1407,14 +1678,28 @@ class ScreensaverPreferencesV4(QMainWindow):
 
         return (row, toggle)
 
-    def create_slider_row(self, label_text: str, value: int, min_val: int, max_val: int, unit: str) -> tuple[QVBoxLayout, QSlider, QLabel]:
-        """Create row with slider and value display"""
+    def create_slider_row(self, label_text: str, value: int, min_val: int, max_val: int, unit: str,
+                          labels: Optional[Tuple[str, ...]] = None) -> tuple[QVBoxLayout, QSlider, QLabel]:
+        """Create row with slider and value display
+
+        labels holds the display text for each slider position from min_val
+        to max_val; by default "<value> <unit>".
+        """
         container = QVBoxLayout()
         container.setSpacing(8)
 
+        # Formatted once here so dragging only indexes a tuple
+        if labels is None:
+            labels = tuple(f"{v} {unit}" for v in range(min_val, max_val + 1))
+
+        slider = QSlider(Qt.Orientation.Horizontal)
+        slider.setMinimum(min_val)
+        slider.setMaximum(max_val)
+        slider.setValue(value)
+
         label_row = QHBoxLayout()
         label = QLabel(label_text)
-        value_label = QLabel(f"{value} {unit}")
+        value_label = QLabel(labels[slider.value() - min_val])
         value_label.setObjectName("valueLabel")
 
         label_row.addWidget(label)
@@ -1422,11 +1707,7 @@ class ScreensaverPreferencesV4(QMainWindow):
         label_row.addWidget(value_label)
         container.addLayout(label_row)
 
-        slider = QSlider(Qt.Orientation.Horizontal)
-        slider.setMinimum(min_val)
-        slider.setMaximum(max_val)
-        slider.setValue(value)
-        slider.valueChanged.connect(lambda v: value_label.setText(f"{v} {unit}"))
+        slider.valueChanged.connect(lambda v: value_label.setText(labels[v - min_val]))
 
         container.addWidget(slider)
 
@@ -1461,7 +1742,7 @@ class ScreensaverPreferencesV4(QMainWindow):
         quit_btn.clicked.connect(self.quit_application)  # Actually quit, don't minimize
 
         # Center: Buy Me a Coffee button (bold and obvious)
-        coffee_btn = QPushButton("☕ Buy Me a Coffee")
+        coffee_btn = QPushButton(emoji_icon("☕"), "Buy Me a Coffee")
         coffee_btn.setObjectName("coffeeButton")
         coffee_btn.setStyleSheet(f"""
             QPushButton#coffeeButton {{
@@ -1484,10 +1765,11 @@ class ScreensaverPreferencesV4(QMainWindow):
         # Store reference for animation
         self.coffee_btn = coffee_btn
 
-        # Start bounce animation timer (every 15 seconds)
-        self.bounce_timer = QTimer()
+        # Bounce animation timer (every 15 seconds) - only runs while the window is shown
+        self.bounce_timer = QTimer(self)
+        self.bounce_timer.setTimerType(Qt.TimerType.CoarseTimer)
+        self.bounce_timer.setInterval(15000)  # 15 seconds
         self.bounce_timer.timeout.connect(self.bounce_coffee_button)
-        self.bounce_timer.start(15000)  # 15 seconds
 
         # Center all buttons in footer with coffee button in middle
         footer.addStretch()  # Left stretch
@@ -1509,8 +1791,12 @@ class ScreensaverPreferencesV4(QMainWindow):
         self.setStatusBar(self.status_bar)
         self.status_bar.showMessage(f"Ready - v{self.app_version}")
 
+    @pyqtSlot()
     def setup_system_tray(self):
         """Setup system tray icon (but don't show it yet - delayed activation)"""
+        if self.tray_icon is not None:
+            return
+
         print(f"🔍 System tray available: {QSystemTrayIcon.isSystemTrayAvailable()}")
 
         if not QSystemTrayIcon.isSystemTrayAvailable():
@@ -1520,15 +1806,9 @@ class ScreensaverPreferencesV4(QMainWindow):
         print("✅ Creating system tray icon...")
         self.tray_icon = QSystemTrayIcon(self)
 
-        # Ensure we use the same icon as the window
-        if hasattr(self, 'app_icon') and not self.app_icon.isNull():
-            self.tray_icon.setIcon(self.app_icon)
-            print(f"   ✅ Systray icon set (using app_icon)")
-        else:
-            print(f"   ⚠️  App icon not available, using fallback")
-            self.tray_icon.setIcon(self.style().standardIcon(self.style().StandardPixmap.SP_ComputerIcon))
-
-        print(f"   Icon null: {self.app_icon.isNull() if hasattr(self, 'app_icon') else 'N/A'}")
+        # Same icon as the window (resolved once in setup_icons)
+        self.tray_icon.setIcon(self.app_icon)
+        print(f"   ✅ Systray icon set (using app_icon)")
 
         # Create tray menu
         tray_menu = QMenu()
@@ -1550,6 +1830,7 @@ class ScreensaverPreferencesV4(QMainWindow):
 
         print("✅ System tray icon configured (will show after 100ms)")
 
+    @pyqtSlot(QSystemTrayIcon.ActivationReason)
     def tray_icon_activated(self, reason):
         """Handle tray icon activation (clicks)"""
         # Trigger is single-click, DoubleClick is double-click
@@ -1559,18 +1840,22 @@ class ScreensaverPreferencesV4(QMainWindow):
             print(f"🖱️  Tray icon clicked (reason: {reason}) - showing window")
             self.show_from_tray()
 
+    @pyqtSlot()
     def show_from_tray(self):
         """Show window from system tray"""
         self.show()
         self.raise_()
         self.activateWindow()
 
+    @pyqtSlot()
     def activate_systray_icon(self):
         """Activate systray icon after delay (called by timer)"""
-        if not hasattr(self, 'tray_icon'):
-            print("❌ No tray icon object - system tray not available")
+        if self.tray_icon is None:
+            print("❌ No tray icon object - system tray not available or disabled")
             return
 
+        if self.tray_icon.isVisible():
+            return
         if self.settings.get('show_taskbar_icon', True):
             self.tray_icon.show()
             print(f"✅ Systray icon activated after 30-second delay")
@@ -1579,15 +1864,15 @@ class ScreensaverPreferencesV4(QMainWindow):
             print("ℹ️  Systray icon not shown (disabled in settings)")
 
 
+    @pyqtSlot(str)
     def on_type_changed(self, text):
         """Handle screensaver type change"""
         self.settings['enabled'] = (text != 'None')
-        self.settings['matrix_mode'] = (text == 'Matrix')
-        self.settings['slideshow_mode'] = (text == 'Slideshow')
-        self.settings['mystify_mode'] = (text == 'Mystify')
-        self.settings['video_mode'] = (text == 'Videos')
+        for type_name, key in self.TYPE_MODE_KEYS:
+            self.settings[key] = (text == type_name)
         self.status_bar.showMessage(f"Screensaver type: {text}")
 
+    @pyqtSlot()
     def browse_folder(self):
         """Browse for slideshow folder"""
         folder = QFileDialog.getExistingDirectory(self, "Select Slideshow Folder")
@@ -1596,6 +1881,7 @@ class ScreensaverPreferencesV4(QMainWindow):
             self.slideshow_folder_label.setText(f"📂 {folder}")
             self.status_bar.showMessage(f"Slideshow folder: {folder}")
 
+    @pyqtSlot()
     def browse_video_folder(self):
         """Browse for video folder"""
         folder = QFileDialog.getExistingDirectory(self, "Select Video Folder")
@@ -1607,42 +1893,31 @@ class ScreensaverPreferencesV4(QMainWindow):
     def detect_touchscreen(self) -> bool:
         """Detect if a touchscreen is connected for UI optimization"""
         try:
-            # Method 1: Check xinput
-            try:
-                result = subprocess.run(['xinput', 'list'],
-                                      capture_output=True, text=True, timeout=2)
-                if 'touch' in result.stdout.lower() or 'touchscreen' in result.stdout.lower():
-                    return True
-            except (subprocess.TimeoutExpired, FileNotFoundError):
-                pass
-
-            # Method 2: Check libinput
-            try:
-                result = subprocess.run(['libinput', 'list-devices'],
-                                      capture_output=True, text=True, timeout=2)
-                if 'touchscreen' in result.stdout.lower():
-                    return True
-            except (subprocess.TimeoutExpired, FileNotFoundError):
-                pass
-
-            # Method 3: Check /proc/bus/input/devices
-            try:
-                with open('/proc/bus/input/devices', 'r', encoding='utf-8') as f:
-                    content = f.read().lower()
-                    if 'touchscreen' in content or 'touch screen' in content:
-                        return True
-            except (IOError, PermissionError):
-                pass
-
+            with open('/proc/bus/input/devices', 'r', encoding='utf-8') as f:
+                content = f.read().lower()
+        except OSError:
             return False
 
-        except Exception as e:
+        # Device names: xinput lists these same kernel names, so matching
+        # 'touch' here covers what forking `xinput list` used to find
+        if 'touch' in content:
+            return True
+
+        # Capabilities: libinput classes a device as a touchscreen when it has
+        # absolute axes and INPUT_PROP_DIRECT (bit 1 of the PROP bitmask), so
+        # unnamed panels are found without forking `libinput list-devices`
+        try:
+            for device in content.split('\n\n'):
+                props = re.search(r'^b: prop=([0-9a-f ]+)$', device, re.MULTILINE)
+                if props and int(props.group(1).split()[-1], 16) & 0x2 and '\nb: abs=' in device:
+                    return True
+        except ValueError as e:
             print(f"⚠️ Touchscreen detection error: {e}")
-            return False
+        return False
 
     def create_styled_messagebox(self, title: str, text: str, icon: QMessageBox.Icon = QMessageBox.Icon.Information) -> QMessageBox:
         """Create a themed message box matching v4 design"""
-        COLORS = COLORS_DARK if self.settings.get('dark_mode', True) else COLORS_LIGHT
+        theme = 'dark' if self.settings.get('dark_mode', True) else 'light'
 
         msg = QMessageBox(self)
         msg.setWindowTitle(title)
@@ -1650,138 +1925,116 @@ class ScreensaverPreferencesV4(QMainWindow):
         msg.setIcon(icon)
 
         # Apply v4 theme styling
-        msg.setStyleSheet(f"""
-            QMessageBox {{
-                background-color: {COLORS['bg_content']};
-                color: {COLORS['text_primary']};
-            }}
-            QMessageBox QLabel {{
-                color: {COLORS['text_primary']};
-                font-size: 14px;
-            }}
-            QMessageBox QPushButton {{
-                background-color: {COLORS['accent_blue']};
-                color: white;
-                border: none;
-                border-radius: 6px;
-                padding: 8px 20px;
-                font-size: 14px;
-                font-weight: 500;
-                min-width: 80px;
-            }}
-            QMessageBox QPushButton:hover {{
-                background-color: #2563EB;
-            }}
-            QMessageBox QPushButton:pressed {{
-                background-color: #1D4ED8;
-            }}
-        """)
+        msg.setStyleSheet(get_messagebox_stylesheet(theme))
 
         return msg
 
+    @pyqtSlot(int)
     def on_theme_changed(self, index):
         """Handle theme change"""
         is_dark = (index == 0)
         self.settings['dark_mode'] = is_dark
         theme_name = 'dark' if is_dark else 'light'
 
-        # Apply new theme with touch mode
+        # Apply new theme live with touch mode - setStyleSheet repolishes and
+        # repaints the whole widget tree, toggles included
         self.setStyleSheet(get_stylesheet(theme_name, self.ui_scale_factor > 1.0))
 
-        # Update toggle switch colors for the new theme
-        self.update_toggle_colors()
-
         self.status_bar.showMessage(f"Theme changed to {theme_name} mode")
 
+    @pyqtSlot(int)
     def on_mystify_color_mode_changed(self, index):
         """Show/hide color sliders based on mystify color mode"""
         # 0 = Rainbow (hide all), 1 = Single (show hue), 2 = Duo (show hue1/hue2)
-        show_single = (index == 1)
-        show_duo = (index == 2)
-
-        # Show/hide single hue slider - iterate through layout items
-        layout = self.mystify_hue_slider[0]
-        for i in range(layout.count()):
-            item = layout.itemAt(i)
-            if item and item.widget():
-                item.widget().setVisible(show_single)
-            elif item and item.layout():
-                for j in range(item.layout().count()):
-                    sub_item = item.layout().itemAt(j)
-                    if sub_item and sub_item.widget():
-                        sub_item.widget().setVisible(show_single)
-
-        # Show/hide duo hue sliders
-        for slider_layout in [self.mystify_hue1_slider[0], self.mystify_hue2_slider[0]]:
-            for i in range(slider_layout.count()):
-                item = slider_layout.itemAt(i)
-                if item and item.widget():
-                    item.widget().setVisible(show_duo)
-                elif item and item.layout():
-                    for j in range(item.layout().count()):
-                        sub_item = item.layout().itemAt(j)
-                        if sub_item and sub_item.widget():
-                            sub_item.widget().setVisible(show_duo)
-
-    def update_toggle_colors(self):
-        """Update toggle switch colors after theme change"""
-        # Toggle switches paint themselves, so we just need to trigger repaints
-        for widget in self.findChildren(ModernToggleSwitch):
-            widget.update()
+        self.mystify_single_hue_panel.setVisible(index == 1)
+        self.mystify_duo_hue_panel.setVisible(index == 2)
+
+    def collect_settings(self) -> dict:
+        """Read the settings shown on every built page into a new dict
+
+        Pages that were never opened cannot have been edited, so their
+        values are left as they are in self.settings.
+        """
+        collected = {}
+        for index in self._built_pages:
+            collected.update(self._page_collectors[index]())
+        return collected
+
+    def _collect_general_settings(self) -> dict:
+        """Settings shown on the General page"""
+        return {
+            'start_on_boot': self.boot_toggle[1].isChecked(),
+            'show_taskbar_icon': self.taskbar_toggle[1].isChecked(),
+            'start_maximized': self.maximized_toggle[1].isChecked(),
+            'enable_touch_ui': self.touch_ui_toggle[1].isChecked(),
+            'dark_mode': (self.theme_control.currentIndex() == 0),
+            'lock_timeout': self.screensaver_slider[1].value() * 60,
+            'auto_shutdown': self.auto_shutdown_toggle[1].isChecked(),
+            'shutdown_timeout': self.shutdown_row[1].value(),
+            'auto_update_check': self.auto_update_toggle[1].isChecked(),
+            'update_notification': self.update_notification_toggle[1].isChecked(),
+            'update_check_frequency': self.update_frequency_slider[1].value(),
+        }
+
+    def _collect_display_settings(self) -> dict:
+        """Settings shown on the Display & Performance page"""
+        fps_text = self.fps_combo.currentText()
+        return {
+            'target_fps': 0 if fps_text == 'Unlimited' else int(fps_text),
+            'auto_cpu_limit': self.cpu_toggle[1].isChecked(),
+            'display_target': self.display_combo.currentText(),
+            'physical_only': self.physical_toggle[1].isChecked(),
+            'show_stats': self.stats_toggle[1].isChecked(),
+            'display_shutdown': self.display_shutdown_toggle[1].isChecked(),
+            'display_shutdown_timeout': self.display_shutdown_slider[1].value(),
+        }
 
+    def _collect_matrix_settings(self) -> dict:
+        """Settings shown on the Matrix page"""
+        color = self.color_combo.currentText()
+        return {
+            'color': color,
+            'rainbow_mode': (color == 'rainbow'),
+            'speed': self.speed_slider[1].value(),
+            'use_katakana': self.katakana_toggle[1].isChecked(),
+            'bold_text': self.bold_toggle[1].isChecked(),
+            'font_size': self.font_size_slider[1].value(),
+        }
+
+    def _collect_mystify_settings(self) -> dict:
+        """Settings shown on the Mystify page"""
+        return {
+            'mystify_shapes': self.shapes_spin.value(),
+            'mystify_complexity': self.complexity_spin.value(),
+            'mystify_speed': self.mystify_speed_spin.value(),
+            'mystify_trail_length': self.trail_spin.value(),
+            'mystify_fill': self.fill_toggle[1].isChecked(),
+            'mystify_color_mode': self.MYSTIFY_COLOR_MODES[self.mystify_color_combo.currentIndex()],
+            'mystify_color_hue': self.mystify_hue_slider[1].value(),
+            'mystify_color_hue1': self.mystify_hue1_slider[1].value(),
+            'mystify_color_hue2': self.mystify_hue2_slider[1].value(),
+        }
+
+    def _collect_slideshow_settings(self) -> dict:
+        """Settings shown on the Slideshow page"""
+        return {
+            'slide_duration': self.duration_spin.value(),
+            'slideshow_random': self.slideshow_random_toggle[1].isChecked(),
+            'slideshow_fit_mode': self.fit_combo.currentText(),
+        }
+
+    def _collect_video_settings(self) -> dict:
+        """Settings shown on the Video page"""
+        return {
+            'video_random': self.video_random_toggle[1].isChecked(),
+            'video_mute': self.video_mute_toggle[1].isChecked(),
+            'video_playback_speed': self.video_speed_slider[1].value() / 4.0,  # Convert from 1-8 to 0.25-2.0
+        }
+
+    @pyqtSlot()
     def apply_settings(self):
         """Apply and save all settings"""
-        # Gather all settings from UI
-        self.settings['start_on_boot'] = self.boot_toggle[1].isChecked()
-        self.settings['show_taskbar_icon'] = self.taskbar_toggle[1].isChecked()
-        self.settings['start_maximized'] = self.maximized_toggle[1].isChecked()
-        self.settings['enable_touch_ui'] = self.touch_ui_toggle[1].isChecked()
-        self.settings['dark_mode'] = (self.theme_control.currentIndex() == 0)
-        self.settings['lock_timeout'] = self.screensaver_slider[1].value() * 60
-        self.settings['auto_shutdown'] = self.auto_shutdown_toggle[1].isChecked()
-        self.settings['shutdown_timeout'] = self.shutdown_row[1].value()
-        self.settings['auto_update_check'] = self.auto_update_toggle[1].isChecked()
-        self.settings['update_notification'] = self.update_notification_toggle[1].isChecked()
-        self.settings['update_check_frequency'] = self.update_frequency_slider[1].value()
-
-        # Display & Performance
-        self.settings['target_fps'] = 0 if self.fps_combo.currentText() == 'Unlimited' else int(self.fps_combo.currentText())
-        self.settings['auto_cpu_limit'] = self.cpu_toggle[1].isChecked()
-        self.settings['display_target'] = self.display_combo.currentText()
-        self.settings['physical_only'] = self.physical_toggle[1].isChecked()
-        self.settings['show_stats'] = self.stats_toggle[1].isChecked()
-        self.settings['display_shutdown'] = self.display_shutdown_toggle[1].isChecked()
-        self.settings['display_shutdown_timeout'] = self.display_shutdown_slider[1].value()
-
-        # Matrix settings
-        self.settings['color'] = self.color_combo.currentText()
-        self.settings['rainbow_mode'] = (self.color_combo.currentText() == 'rainbow')
-        self.settings['speed'] = self.speed_slider[1].value()
-        self.settings['use_katakana'] = self.katakana_toggle[1].isChecked()
-        self.settings['bold_text'] = self.bold_toggle[1].isChecked()
-        self.settings['font_size'] = self.font_size_slider[1].value()
-
-        # Mystify settings
-        self.settings['mystify_shapes'] = self.shapes_spin.value()
-        self.settings['mystify_complexity'] = self.complexity_spin.value()
-        self.settings['mystify_speed'] = self.mystify_speed_spin.value()
-        self.settings['mystify_trail_length'] = self.trail_spin.value()
-        self.settings['mystify_fill'] = self.fill_toggle[1].isChecked()
-        color_mode_map = {0: 'rainbow', 1: 'single', 2: 'duo'}
-        self.settings['mystify_color_mode'] = color_mode_map[self.mystify_color_combo.currentIndex()]
-        self.settings['mystify_color_hue'] = self.mystify_hue_slider[1].value()
-        self.settings['mystify_color_hue1'] = self.mystify_hue1_slider[1].value()
-        self.settings['mystify_color_hue2'] = self.mystify_hue2_slider[1].value()
-
-        # Slideshow settings
-        self.settings['slide_duration'] = self.duration_spin.value()
-        self.settings['slideshow_random'] = self.slideshow_random_toggle[1].isChecked()
-        self.settings['slideshow_fit_mode'] = self.fit_combo.currentText()
-
-        # Video settings
-        self.settings['video_random'] = self.video_random_toggle[1].isChecked()
-        self.settings['video_mute'] = self.video_mute_toggle[1].isChecked()
-        self.settings['video_playback_speed'] = self.video_speed_slider[1].value() / 4.0  # Convert from 1-8 to 0.25-2.0
+        self.settings.update(self.collect_settings())
 
         if self.save_settings():
             # Update autostart configuration
@@ -1789,12 +2042,13 @@ class ScreensaverPreferencesV4(QMainWindow):
 
             self.status_bar.showMessage("✅ Settings saved - minimizing to tray")
 
-            # Update systray visibility based on settings
-            if hasattr(self, 'tray_icon'):
-                if self.settings['show_taskbar_icon']:
-                    self.tray_icon.show()
-                else:
-                    self.tray_icon.hide()
+            # Update systray visibility based on settings - only touch the
+            # status notifier item when the state actually changes
+            show_icon = self.settings['show_taskbar_icon']
+            if show_icon and self.tray_icon is None:
+                self.setup_system_tray()
+            if self.tray_icon is not None and self.tray_icon.isVisible() != show_icon:
+                self.tray_icon.setVisible(show_icon)
 
             # Show restart message if touch UI was changed
             if self.settings['enable_touch_ui'] != (self.ui_scale_factor > 1.0):
@@ -1814,38 +2068,47 @@ class ScreensaverPreferencesV4(QMainWindow):
 
     def setup_autostart(self, enable: bool) -> None:
         """Configure application to start on boot"""
-        autostart_dir = Path.home() / '.config' / 'autostart'
-        autostart_file = autostart_dir / 'screensaver-preferences-v4.desktop'
+        # Already applied in this session - nothing to touch on disk
+        if enable == self._autostart_enabled:
+            return
 
         try:
-            autostart_dir.mkdir(parents=True, exist_ok=True)
-
             if enable:
-                # Get the path to the installed script
-                script_path = Path.home() / '.local' / 'bin' / 'screensaver_preferences_v4.py'
-                if not script_path.exists():
-                    script_path = Path(__file__).resolve()
+                os.makedirs(AUTOSTART_DIR, exist_ok=True)
 
-                desktop_entry = f"""[Desktop Entry]
-Type=Application
-Name=Screensaver Preferences v4
-Comment=Modern screensaver control panel
-Exec={script_path}
-Icon=preferences-desktop-screensaver
-Terminal=false
-Categories=Settings;System;
-X-GNOME-Autostart-enabled=true
-StartupNotify=false
-"""
-                with open(autostart_file, 'w', encoding='utf-8') as f:
-                    f.write(desktop_entry)
-                autostart_file.chmod(0o755)
+                # Get the path to the installed script
+                script_path = os.path.join(LOCAL_BIN_DIR, 'screensaver_preferences_v4.py')
+                if not os.path.exists(script_path):
+                    script_path = os.path.realpath(__file__)
+
+                # Leave an identical entry from a previous session untouched
+                desktop_entry = AUTOSTART_DESKTOP_ENTRY.format(exec_path=script_path)
+                try:
+                    with open(AUTOSTART_FILE, 'r', encoding='utf-8') as f:
+                        existing_entry = f.read()
+                except FileNotFoundError:
+                    existing_entry = None
+                if existing_entry != desktop_entry:
+                    # Write next to the target and rename over it, so a crash
+                    # never leaves a half-written entry in autostart
+                    fd, tmp_path = tempfile.mkstemp(dir=AUTOSTART_DIR, suffix='.tmp')
+                    try:
+                        with os.fdopen(fd, 'wb') as f:
+                            f.write(desktop_entry.encode('utf-8'))
+                            os.fchmod(f.fileno(), 0o755)
+                        os.replace(tmp_path, AUTOSTART_FILE)
+                    except OSError:
+                        os.unlink(tmp_path)
+                        raise
                 self.status_bar.showMessage("✅ Autostart enabled")
             else:
                 # Remove autostart file
-                if autostart_file.exists():
-                    autostart_file.unlink()
+                try:
+                    os.unlink(AUTOSTART_FILE)
+                except FileNotFoundError:
+                    pass
                 self.status_bar.showMessage("✅ Autostart disabled")
+            self._autostart_enabled = enable
         except Exception as e:
             self.status_bar.showMessage(f"❌ Autostart configuration failed: {e}")
 
@@ -1879,6 +2142,7 @@ StartupNotify=false
 
     def check_for_updates(self, manual: bool = False) -> None:
         """Check for updates from GitHub releases"""
+        import datetime
         import urllib.request
         import urllib.error
 
@@ -1944,6 +2208,7 @@ StartupNotify=false
 
     def should_check_for_updates(self) -> bool:
         """Check if it's time to perform an update check"""
+        import datetime
         last_check = self.settings.get('last_update_check', '')
         if not last_check:
             return True
@@ -1970,84 +2235,78 @@ StartupNotify=false
         except (ValueError, AttributeError):
             return False
 
+    @pyqtSlot()
     def test_screensaver(self):
         """Test the screensaver"""
         screensaver_type = self.type_combo.currentText()
+        launcher = self._test_launchers.get(screensaver_type)
+        if launcher is None:
+            msg = self.create_styled_messagebox("No Screensaver", "Please select a screensaver type first", QMessageBox.Icon.Warning)
+            msg.exec()
+            return
+
+        # The test reads its options straight from that type's page
+        self.ensure_page(self.TYPE_PAGE_INDEX[screensaver_type])
         self.status_bar.showMessage(f"Testing {screensaver_type} screensaver...")
 
         try:
-            if screensaver_type == 'Matrix':
-                from sidekick_widget import MatrixScreensaver
-                settings = {
-                    'color': self.color_combo.currentText(),
-                    'speed': self.speed_slider[1].value(),
-                    'bold': self.bold_toggle[1].isChecked(),
-                    'rainbow': (self.color_combo.currentText() == 'rainbow'),
-                    'use_katakana': self.katakana_toggle[1].isChecked(),
-                    'font_size': self.font_size_slider[1].value(),
-                    'show_stats': self.settings.get('show_stats', False),
-                }
-                self.test_window = MatrixScreensaver(settings)
-                self.test_window.show()
-
-            elif screensaver_type == 'Mystify':
-                from mystify_widget import MystifyScreensaver
-                color_mode_map = {0: 'rainbow', 1: 'single', 2: 'duo'}
-                settings = {
-                    'mystify_shapes': self.shapes_spin.value(),
-                    'mystify_complexity': self.complexity_spin.value(),
-                    'mystify_speed': self.mystify_speed_spin.value(),
-                    'mystify_trail_length': self.trail_spin.value(),
-                    'mystify_fill': self.fill_toggle[1].isChecked(),
-                    'mystify_color_mode': color_mode_map[self.mystify_color_combo.currentIndex()],
-                    'mystify_color_hue': self.mystify_hue_slider[1].value(),
-                    'mystify_color_hue1': self.mystify_hue1_slider[1].value(),
-                    'mystify_color_hue2': self.mystify_hue2_slider[1].value(),
-                    'show_stats': self.settings.get('show_stats', False),
-                }
-                self.test_window = MystifyScreensaver(settings)
-                self.test_window.show()
-
-            elif screensaver_type == 'Slideshow':
-                if not self.settings.get('slideshow_folder'):
-                    msg = self.create_styled_messagebox("No Folder", "Please select a slideshow folder first in the Slideshow page", QMessageBox.Icon.Warning)
-                    msg.exec()
-                else:
-                    from slideshow_widget import SlideshowScreensaver
-                    settings = {
-                        'slideshow_folder': self.settings.get('slideshow_folder'),
-                        'slide_duration': self.duration_spin.value(),
-                        'slideshow_random': self.slideshow_random_toggle[1].isChecked(),
-                        'slideshow_fit_mode': self.fit_combo.currentText(),
-                        'show_stats': self.settings.get('show_stats', False),
-                    }
-                    self.test_window = SlideshowScreensaver(settings)
-                    self.test_window.slideshow_widget.show()
-
-            elif screensaver_type == 'Videos':
-                if not self.settings.get('video_folder'):
-                    msg = self.create_styled_messagebox("No Folder", "Please select a video folder first in the Videos page", QMessageBox.Icon.Warning)
-                    msg.exec()
-                else:
-                    from video_widget import VideoScreensaver
-                    settings = {
-                        'video_folder': self.settings.get('video_folder'),
-                        'video_random': self.video_random_toggle[1].isChecked(),
-                        'video_mute': self.video_mute_toggle[1].isChecked(),
-                        'video_playback_speed': self.video_speed_slider[1].value() / 4.0,
-                        'show_stats': self.settings.get('show_stats', False),
-                    }
-                    # VideoScreensaver shows itself in fullscreen during __init__
-                    self.test_window = VideoScreensaver(settings)
-                    self.status_bar.showMessage("Video test running - press any key or click to exit")
-
-            else:
-                msg = self.create_styled_messagebox("No Screensaver", "Please select a screensaver type first", QMessageBox.Icon.Warning)
-                msg.exec()
+            launcher(self.settings.get('show_stats', False))
         except Exception as e:
             msg = self.create_styled_messagebox("Error", f"Failed to test: {e}", QMessageBox.Icon.Critical)
             msg.exec()
 
+    def test_matrix(self, show_stats: bool) -> None:
+        """Launch a Matrix test window from the Matrix page"""
+        from sidekick_widget import MatrixScreensaver
+        color = self.color_combo.currentText()
+        settings = {
+            'color': color,
+            'speed': self.speed_slider[1].value(),
+            'bold': self.bold_toggle[1].isChecked(),
+            'rainbow': (color == 'rainbow'),
+            'use_katakana': self.katakana_toggle[1].isChecked(),
+            'font_size': self.font_size_slider[1].value(),
+            'show_stats': show_stats,
+        }
+        self.test_window = MatrixScreensaver(settings)
+        self.test_window.show()
+
+    def test_mystify(self, show_stats: bool) -> None:
+        """Launch a Mystify test window from the Mystify page"""
+        from mystify_widget import MystifyScreensaver
+        settings = self._collect_mystify_settings()
+        settings['show_stats'] = show_stats
+        self.test_window = MystifyScreensaver(settings)
+        self.test_window.show()
+
+    def test_slideshow(self, show_stats: bool) -> None:
+        """Launch a slideshow test window from the Slideshow page"""
+        if not self.settings.get('slideshow_folder'):
+            msg = self.create_styled_messagebox("No Folder", "Please select a slideshow folder first in the Slideshow page", QMessageBox.Icon.Warning)
+            msg.exec()
+            return
+        from slideshow_widget import SlideshowScreensaver
+        settings = self._collect_slideshow_settings()
+        settings['slideshow_folder'] = self.settings.get('slideshow_folder')
+        settings['show_stats'] = show_stats
+        self.test_window = SlideshowScreensaver(settings)
+        self.test_window.slideshow_widget.show()
+
+    def test_videos(self, show_stats: bool) -> None:
+        """Launch a video test window from the Videos page"""
+        if not self.settings.get('video_folder'):
+            msg = self.create_styled_messagebox("No Folder", "Please select a video folder first in the Videos page", QMessageBox.Icon.Warning)
+            msg.exec()
+            return
+        from video_widget import VideoScreensaver
+        settings = self._collect_video_settings()
+        settings['video_folder'] = self.settings.get('video_folder')
+        settings['show_stats'] = show_stats
+        # VideoScreensaver shows itself in fullscreen during __init__
+        self.test_window = VideoScreensaver(settings)
+        self.status_bar.showMessage("Video test running - press any key or click to exit")
+
+    @pyqtSlot()
     def show_about(self):
         """Show about dialog with logo and bio"""
         # Create custom dialog with logo
@@ -2068,30 +2327,7 @@ StartupNotify=false
             scaled_pixmap = pixmap.scaled(100, 100, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation)
             dialog.setIconPixmap(scaled_pixmap)
 
-        about_text = f"""<h3>🎬 Sidekick Screensaver</h3>
-<p><b>Version:</b> {self.app_version} (Modern UI Edition)</p>
-<p><b>Updated:</b> {self.build_date}</p>
-<p><b>Developer:</b> Guy Mayer</p>
-
-<h4>👋 About the Developer:</h4>
-<p>Hello! I'm a professional photographer and tango teacher, but my other full-time passion is coding.</p>
-
-<p>I'm currently stuck on a major 'bug': The resources I need to level up (pro courses, new software, hosting) cost money. It's the one 'refactor' I can't do alone.</p>
-
-<p><b>You can be the hero who helps me resolve this ticket.</b></p>
-
-<p>Every coffee you send is a direct contribution to my coding 'stack.' You're not just donating; you're actively helping me debug my finances so I can get back to building.</p>
-
-<p>I can't wait to see what we build. Thank you for your support!</p>
-
-<h4>🛠️ Features:</h4>
-<ul>
-<li>Multiple screensaver modes (Matrix, Mystify, Slideshow)</li>
-<li>System tray integration</li>
-<li>Auto-shutdown timer</li>
-<li>Performance monitoring</li>
-<li>Multi-display support</li>
-</ul>"""
+        about_text = ABOUT_HTML.format(version=self.app_version, build_date=get_build_date())
 
         dialog.setText(about_text)
         dialog.setStandardButtons(QMessageBox.StandardButton.Ok)
@@ -2122,6 +2358,7 @@ StartupNotify=false
 
         dialog.exec()
 
+    @pyqtSlot()
     def open_coffee_link(self):
         """Open Buy Me a Coffee link in browser"""
         import webbrowser
@@ -2137,11 +2374,9 @@ StartupNotify=false
             )
             msg.exec()
 
+    @pyqtSlot()
     def bounce_coffee_button(self):
         """Make the coffee button bounce to attract attention"""
-        if not hasattr(self, 'coffee_btn'):
-            return
-
         # Get original position
         original_pos = self.coffee_btn.pos()
 
@@ -2158,10 +2393,9 @@ StartupNotify=false
         # Start the animation
         self.bounce_animation.start()
 
+    @pyqtSlot()
     def run_diagnostics(self):
         """Run system diagnostics to help troubleshoot issues"""
-        import subprocess
-
         diagnostics = []
 
         # Check PyQt6
@@ -2171,17 +2405,9 @@ StartupNotify=false
         except (ImportError, AttributeError):
             diagnostics.append("PyQt6: Available")
 
-        # Check required binaries
-        required_bins = [
-            ('wmctrl', 'Window management'),
-            ('xdotool', 'Window manipulation'),
-            ('swayidle', 'Wayland idle detection'),
-            ('lxterminal', 'Terminal emulator'),
-            ('x-terminal-emulator', 'Alternative terminal')
-        ]
-
-        for binary, description in required_bins:
-            if subprocess.run(['which', binary], capture_output=True).returncode == 0:
+        # Check required binaries (PATH lookup in-process, no `which` fork per binary)
+        for binary, description in self.DIAGNOSTIC_BINARIES:
+            if shutil.which(binary) is not None:
                 diagnostics.append(f"{binary}: Available ({description})")
             else:
                 diagnostics.append(f"❌ {binary}: Not found ({description})")
@@ -2203,6 +2429,7 @@ StartupNotify=false
         msg = self.create_styled_messagebox("System Diagnostics", f"<h3>System Diagnostics Report</h3><pre>{result_text}</pre>")
         msg.exec()
 
+    @pyqtSlot()
     def on_screensaver_timeout(self) -> None:
         """Handle screensaver timer timeout - launch the screensaver"""
         if not self.settings.get('enabled', True):
@@ -2211,41 +2438,46 @@ StartupNotify=false
         print("⏰ Screensaver timer triggered - launching screensaver")
 
         # Determine which screensaver type to launch
-        screensaver_type = self.type_combo.currentText() if hasattr(self, 'type_combo') else 'Matrix'
+        try:
+            screensaver_type = self.type_combo.currentText()
+        except RuntimeError:
+            # Underlying C++ combo already deleted (window torn down)
+            screensaver_type = 'Matrix'
 
         try:
             # Launch the sidekick screensaver with appropriate parameters
-            script_path = Path.home() / '.local' / 'bin' / 'sidekick_screensaver.sh'
-            if not script_path.exists():
-                script_path = Path(__file__).parent / 'sidekick_screensaver.sh'
-
-            if script_path.exists():
-                subprocess.Popen([str(script_path)], start_new_session=True)
-                self.screensaver_active = True
-                print(f"✅ Launched {screensaver_type} screensaver")
-            else:
-                print(f"⚠️  Screensaver script not found: {script_path}")
+            script_path = os.path.join(LOCAL_BIN_DIR, 'sidekick_screensaver.sh')
+            if not os.path.exists(script_path):
+                script_path = os.path.join(_SCRIPT_DIR, 'sidekick_screensaver.sh')
 
+            subprocess.Popen([script_path], start_new_session=True)
+            self.screensaver_active = True
+            print(f"✅ Launched {screensaver_type} screensaver")
+
+        except FileNotFoundError:
+            print(f"⚠️  Screensaver script not found: {script_path}")
         except Exception as e:
             print(f"❌ Failed to launch screensaver: {e}")
 
     def start_shutdown_timer(self):
         """Start auto-shutdown timer"""
         timeout_minutes = self.settings.get('shutdown_timeout', 60)
-        timeout_ms = timeout_minutes * 60 * 1000
-
-        self.shutdown_timer = QTimer()
-        self.shutdown_timer.timeout.connect(self.on_shutdown_timeout)  # type: ignore
-        self.shutdown_timer.setSingleShot(True)
-        self.shutdown_timer.start(timeout_ms)
+        self.shutdown_timer.start(timeout_minutes * 60 * 1000)
 
         print(f"🕒 Auto-shutdown timer started: {timeout_minutes} minutes")
 
+    @pyqtSlot()
     def on_shutdown_timeout(self) -> None:
         """Handle auto-shutdown timeout"""
         print("⏰ Auto-shutdown timer triggered")
+        # /usr/sbin is not on a regular user's PATH on Bookworm - pick the first
+        # command that resolves instead of forking ones that cannot run
+        command = next((cmd for cmd in self.SHUTDOWN_COMMANDS if shutil.which(cmd[0])), None)
+        if command is None:
+            print("❌ Shutdown failed: no shutdown command found")
+            return
         try:
-            subprocess.run(['shutdown', '-h', 'now'], check=False)
+            subprocess.Popen(command, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
         except Exception as e:
             print(f"❌ Shutdown failed: {e}")
 
@@ -2255,21 +2487,18 @@ StartupNotify=false
             return
 
         timeout_minutes = self.settings.get('display_shutdown_timeout', 30)
-        timeout_ms = timeout_minutes * 60 * 1000
-
-        self.display_shutdown_timer = QTimer()
-        self.display_shutdown_timer.timeout.connect(self.turn_off_displays)  # type: ignore
-        self.display_shutdown_timer.setSingleShot(True)
-        self.display_shutdown_timer.start(timeout_ms)
+        self.display_shutdown_timer.start(timeout_minutes * 60 * 1000)
 
         print(f"🖥️ Display shutdown timer started: {timeout_minutes} minutes")
 
+    @pyqtSlot()
     def turn_off_displays(self) -> None:
         """Turn off displays using xset dpms"""
         print("🖥️ Turning off displays...")
         try:
             # Force displays off immediately
-            subprocess.run(['xset', 'dpms', 'force', 'off'], check=False)
+            subprocess.Popen(['xset', 'dpms', 'force', 'off'],
+                             stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
             print("✅ Displays turned off")
         except Exception as e:
             print(f"❌ Failed to turn off displays: {e}")
@@ -2277,69 +2506,81 @@ StartupNotify=false
     def showEvent(self, event):
         """Handle window show - pause timers"""
         super().showEvent(event)
-        # Stop timers when GUI is visible
-        if hasattr(self, 'screensaver_timer'):
-            self.screensaver_timer.stop()
-        if hasattr(self, 'progress_timer'):
-            self.progress_timer.stop()
-        # Update status bar
-        if hasattr(self, 'status_bar'):
-            self.status_bar.showMessage(f"Ready - v{self.app_version} (Timers paused while GUI shown)")
+        # Stop timers when GUI is visible (timers and status bar always exist once __init__ has run)
+        self.screensaver_timer.stop()
+        self.bounce_timer.start()
+        self.status_bar.showMessage(f"Ready - v{self.app_version} (Timers paused while GUI shown)")
+        # Import the selected type's widget once the window is up, so the
+        # first Test click doesn't pay for it
+        QTimer.singleShot(500, self.preload_test_widget)
+
+    @pyqtSlot()
+    def preload_test_widget(self) -> None:
+        """Import the widget module for the selected screensaver type"""
+        module_name = self.TYPE_WIDGET_MODULE.get(self.type_combo.currentText())
+        if module_name is None or module_name in sys.modules:
+            return
+        try:
+            importlib.import_module(module_name)
+        except ImportError as e:
+            print(f"⚠️  Could not preload {module_name}: {e}")
 
     def hideEvent(self, event):
         """Handle window hide - resume timers"""
         super().hideEvent(event)
         # Restart timers when GUI is hidden
-        if hasattr(self, 'screensaver_timer') and self.settings.get('enabled', True):
-            timeout_secs = self.settings.get('lock_timeout', 300)
-            self.screensaver_timer.start(timeout_secs * 1000)
-        if hasattr(self, 'progress_timer'):
-            self.progress_timer.start(1000)
-        # Update status bar
-        if hasattr(self, 'status_bar'):
-            self.status_bar.showMessage(f"Timers resumed - screensaver will start after {self.settings.get('lock_timeout', 300) // 60} minutes")
+        self.bounce_timer.stop()
+        settings = self.settings
+        lock_timeout = settings.get('lock_timeout', 300)
+        if settings.get('enabled', True):
+            self.screensaver_timer.start(lock_timeout * 1000)
+        self.status_bar.showMessage(f"Timers resumed - screensaver will start after {lock_timeout // 60} minutes")
 
     def closeEvent(self, event):
         """Handle window close - minimize to tray if enabled, otherwise quit"""
         # If systray is enabled and available, minimize to tray instead of closing
-        if (hasattr(self, 'tray_icon') and
+        if (self.tray_icon is not None and
             self.tray_icon.isVisible() and
             self.settings.get('show_taskbar_icon', True)):
 
-            print("ℹ️  Minimizing to system tray (window hidden, timers still running)")
             event.ignore()  # Don't close the window
+            # Already in the tray - nothing to hide and no need to notify again
+            if not self.isVisible():
+                return
+
+            print("ℹ️  Minimizing to system tray (window hidden, timers still running)")
             self.hide()     # Just hide it - timers keep running!
 
             # Show a notification that we're still running
-            if hasattr(self, 'tray_icon'):
-                self.tray_icon.showMessage(
-                    "Screensaver Settings",
-                    "Running in background. Timers active. Click icon to restore.",
-                    QSystemTrayIcon.MessageIcon.Information,
-                    2000
-                )
+            self.tray_icon.showMessage(
+                "Screensaver Settings",
+                "Running in background. Timers active. Click icon to restore.",
+                QSystemTrayIcon.MessageIcon.Information,
+                2000
+            )
         else:
             # No systray - actually quit
             self.quit_application()
             event.accept()
 
+    @pyqtSlot()
     def quit_application(self):
         """Actually quit the application"""
         print("🛑 Quitting application...")
 
         # Stop any running test screensavers
-        if hasattr(self, 'test_window') and self.test_window:
+        if self.test_window is not None:
             try:
                 # If it's a VideoScreensaver, make sure VLC is killed
                 from video_widget import VideoScreensaver
-                if isinstance(self.test_window, VideoScreensaver) and hasattr(self.test_window, 'video_player'):
+                if isinstance(self.test_window, VideoScreensaver):
                     self.test_window.video_player.stop_vlc()
                 self.test_window.close()
             except Exception as e:
                 print(f"Error closing test window: {e}")
 
         self.save_settings()
-        if hasattr(self, 'tray_icon'):
+        if self.tray_icon is not None:
             self.tray_icon.hide()
 
         QApplication.quit()
@@ -2394,17 +2635,12 @@ def main() -> int:
     splash = None
     if not start_minimized:
         # Load settings to determine dark mode
-        config_dir = Path.home() / '.config' / 'screensaver'
-        config_file = config_dir / 'settings.json'
         dark_mode = True  # Default
 
-        if config_file.exists():
-            try:
-                with open(config_file, 'r', encoding='utf-8') as f:
-                    settings = json.load(f)
-                    dark_mode = settings.get('dark_mode', True)
-            except Exception:
-                pass
+        try:
+            dark_mode = read_settings_file(CONFIG_FILE).get('dark_mode', True)
+        except Exception:
+            pass
 
         splash = create_splash_screen(dark_mode)
         if splash:
@@ -2431,9 +2667,13 @@ def main() -> int:
 
     # Handle boot startup (minimized to tray)
     if start_minimized:
-        # Show systray icon immediately
-        if hasattr(window, 'tray_icon'):
-            window.tray_icon.show()
+        # Show systray icon on the first event-loop pass - building it even if
+        # disabled in settings, since it is the only way back to a hidden window
+        def show_tray_icon():
+            window.setup_system_tray()
+            if window.tray_icon is not None:
+                window.tray_icon.show()
+        QTimer.singleShot(0, show_tray_icon)
 
         # Show boot notification if physical display detected
         QTimer.singleShot(500, window.show_boot_notification)
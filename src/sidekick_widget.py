@@ -16,6 +16,10 @@ Created: September 2025
 """
 
 import sys
+import os
+import re
+import signal
+import subprocess
 import random
 import time
 from typing import List, Optional
@@ -23,6 +27,40 @@ from PyQt6.QtWidgets import QWidget, QApplication, QMainWindow
 from PyQt6.QtCore import QTimer, Qt, QPoint, pyqtSignal, QEvent
 from PyQt6.QtGui import QPainter, QFont, QColor, QPen, QFontMetrics, QPaintEvent, QKeyEvent, QMouseEvent
 
+# /proc/interrupts rows for USB/HID controllers; group 1 is the per-CPU counts
+_USB_IRQ_LINE = re.compile(
+    rb'^[ \t]*\S+:((?:[ \t]+\d+)+)[^\n]*?(?:usb|ehci|ohci|xhci|hid|input|mouse|keyboard)',
+    re.MULTILINE | re.IGNORECASE,
+)
+
+
+def find_processes(pattern: bytes) -> List[int]:
+    """PIDs whose full command line matches pattern - same match as `pgrep -f`, without forking"""
+    regex = re.compile(pattern)
+    own_pid = os.getpid()
+    pids = []
+    try:
+        proc_entries = os.scandir('/proc')
+    except OSError:
+        return pids
+    with proc_entries:
+        for entry in proc_entries:
+            if not entry.name.isdigit():
+                continue
+            pid = int(entry.name)
+            if pid == own_pid:
+                continue
+            try:
+                with open(f'/proc/{pid}/cmdline', 'rb') as f:
+                    cmdline = f.read().replace(b'\0', b' ')
+            except OSError:
+                # Process exited between listing and read
+                continue
+            if regex.search(cmdline):
+                pids.append(pid)
+    return pids
+
+
 class MatrixColumn:
     """Represents a single column of Matrix characters"""
 
@@ -176,7 +214,6 @@ class MatrixWidget(QWidget):
         # Creating new Process() each time causes cpu_percent() to return 0.0
         try:
             import psutil
-            import os
             self.current_process = psutil.Process(os.getpid())
             self.current_process.cpu_percent()  # Baseline call (first call returns 0.0)
         except ImportError:
@@ -186,7 +223,6 @@ class MatrixWidget(QWidget):
         # Creating new Process() each time causes cpu_percent() to return 0.0
         try:
             import psutil
-            import os
             self.current_process = psutil.Process(os.getpid())
             self.current_process.cpu_percent()  # Baseline call (first call returns 0.0)
         except ImportError:
@@ -239,9 +275,11 @@ class MatrixWidget(QWidget):
 
         # USB Activity Monitoring Timer for physical input detection
         self.usb_monitor_timer = QTimer()
+        self.usb_monitor_timer.setTimerType(Qt.TimerType.CoarseTimer)  # polling, may be batched with other wakeups
         self.usb_monitor_timer.timeout.connect(self.check_usb_activity)
         self.usb_interrupt_baseline = None
-        self.last_usb_check = time.time()
+        self.last_usb_error: Optional[str] = None
+        self.interrupts_file = None  # /proc/interrupts, kept open between polls
 
         # Start USB monitoring every 500ms for responsive USB device detection
         self.usb_monitor_timer.start(500)
@@ -433,9 +471,12 @@ class MatrixWidget(QWidget):
         """Draw a single Matrix column with MAXIMUM performance optimizations"""
         screen_height = self.height()
 
-        # Pre-calculate time-based values once per column
+        # Pre-calculate per-column values once instead of per character
+        rainbow = self.settings['rainbow']
+        fade_colors = self.fade_colors
+        last_fade_index = len(fade_colors) - 1
         current_time = time.time()
-        if self.settings['rainbow']:
+        if rainbow:
             base_hue = (current_time * 100 + column.x) % 360
 
         # OPTIMIZATION: Further reduced max trail length (was 15, now 10)
@@ -452,21 +493,20 @@ class MatrixWidget(QWidget):
 
             # Determine color based on position in trail
             if i == 0:  # Head character
-                if self.settings['rainbow']:
+                if rainbow:
                     # OPTIMIZATION: Use pre-calculated base hue
                     color = QColor.fromHsv(int(base_hue), 255, 255)
                 else:
                     color = self.head_color
             else:
                 # Trailing characters with fade
-                if self.settings['rainbow']:
+                if rainbow:
                     # OPTIMIZATION: Reduce HSV calculations - faster fade, fewer colors
                     hue = int((base_hue + i * 30) % 360)  # Larger hue steps
                     brightness = max(30, 255 - i * 25)  # Faster fade (was 12)
                     color = QColor.fromHsv(hue, 255, brightness)
                 else:
-                    fade_index = min(i, len(self.fade_colors) - 1)
-                    color = self.fade_colors[fade_index]
+                    color = fade_colors[min(i, last_fade_index)]
 
             painter.setPen(color)  # OPTIMIZATION: Removed QPen wrapper
             painter.drawText(int(column.x), int(pos), char)  # OPTIMIZATION: Use ints
@@ -492,7 +532,6 @@ class MatrixWidget(QWidget):
         if self.settings.get('auto_cpu_limit', False) or self.settings.get('show_stats', False):
             try:
                 import psutil
-                import os
 
                 # Update stats every second
                 if current_time - self.last_stats_update >= 1.0:
@@ -655,8 +694,6 @@ class MatrixWidget(QWidget):
     def restore_desktop_environment(self):
         """Restore taskbar and desktop environment after screensaver"""
         try:
-            import subprocess
-            import os
             print("🖥️ Restoring desktop environment...")
 
             # Detect display server type
@@ -689,16 +726,20 @@ class MatrixWidget(QWidget):
                     pass
 
             # Final fallback: Manual restoration with warning suppression
+            # (panel and desktop manager are started with the same environment)
+            env = os.environ.copy()
+            if is_wayland:
+                env['GDK_BACKEND'] = 'wayland'
+
             try:
                 # Kill existing panel
-                subprocess.run(["pkill", "-f", "lxpanel"], timeout=2, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+                for pid in find_processes(rb'lxpanel'):
+                    try:
+                        os.kill(pid, signal.SIGTERM)
+                    except OSError:
+                        pass
 
-                # Start panel quietly
-                env = os.environ.copy()
-                if is_wayland:
-                    env['GDK_BACKEND'] = 'wayland'
-
-                # Use nohup to suppress all output and warnings
+                # Start panel quietly - nohup suppresses all output and warnings
                 subprocess.Popen(["nohup", "lxpanel"], env=env,
                                stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
 
@@ -708,13 +749,7 @@ class MatrixWidget(QWidget):
 
             # Check if desktop manager is running before starting it
             try:
-                result = subprocess.run(["pgrep", "-f", "pcmanfm.*desktop"],
-                                      capture_output=True, timeout=2)
-                if result.returncode != 0:  # Not running
-                    env = os.environ.copy()
-                    if is_wayland:
-                        env['GDK_BACKEND'] = 'wayland'
-
+                if not find_processes(rb'pcmanfm.*desktop'):  # Not running
                     subprocess.Popen(["nohup", "pcmanfm", "--desktop"], env=env,
                                    stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
                     print("✅ Desktop manager started quietly")
@@ -732,32 +767,15 @@ class MatrixWidget(QWidget):
     def check_usb_activity(self):
         """Monitor USB interrupts for physical device activity (mouse/keyboard)"""
         try:
-            current_time = time.time()
-
-            # Read USB/HID interrupt data from /proc/interrupts
-            with open('/proc/interrupts', 'r', encoding='utf-8') as f:
-                content = f.read()
-
-            usb_interrupts = 0
-            hid_interrupts = 0
-
-            # Look for ALL USB/HID related interrupts
-            for line in content.split('\n'):
-                line_lower = line.lower()
-                if any(keyword in line_lower for keyword in ['usb', 'ehci', 'ohci', 'xhci', 'hid', 'input', 'mouse', 'keyboard']):
-                    parts = line.split()
-                    if len(parts) > 1:
-                        # Sum all CPU columns (skip first column which is IRQ number)
-                        for i in range(1, len(parts)):
-                            if parts[i].isdigit():
-                                if 'usb' in line_lower or 'ehci' in line_lower or 'ohci' in line_lower or 'xhci' in line_lower:
-                                    usb_interrupts += int(parts[i])
-                                else:
-                                    hid_interrupts += int(parts[i])
-                            else:
-                                break
-
-            total_interrupts = usb_interrupts + hid_interrupts
+            # procfs regenerates the file on every read from offset 0
+            if self.interrupts_file is None:
+                self.interrupts_file = open('/proc/interrupts', 'rb', buffering=0)
+            self.interrupts_file.seek(0)
+            content = self.interrupts_file.read()
+
+            # Sum the per-CPU counts of every USB/HID row in one regex pass
+            total_interrupts = sum(int(count) for match in _USB_IRQ_LINE.finditer(content)
+                                   for count in match.group(1).split())
 
             # Initialize baseline on first run
             if self.usb_interrupt_baseline is None:
@@ -779,11 +797,16 @@ class MatrixWidget(QWidget):
                 self.usb_interrupt_baseline = total_interrupts
 
         except Exception as e:
-            # If we can't read interrupts, fall back to timer-based check
-            elapsed = current_time - self.last_usb_check
-            if elapsed > 5:  # Show error every 5 seconds
-                print(f"⚠️ USB monitoring error: {e}")
-                self.last_usb_check = current_time
+            # Reopen on the next poll in case the handle itself went bad
+            if self.interrupts_file is not None:
+                self.interrupts_file.close()
+                self.interrupts_file = None
+            # If we can't read interrupts, report each distinct error once
+            # rather than re-formatting the same one on every 500ms poll
+            error = str(e)
+            if error != self.last_usb_error:
+                print(f"⚠️ USB monitoring error: {error}")
+                self.last_usb_error = error
 
 class MatrixScreensaver(QMainWindow):
     """Fullscreen Matrix screensaver window"""
@@ -910,25 +933,17 @@ class MatrixScreensaver(QMainWindow):
 
     def hide_taskbar_and_maximize(self):
         """Use system-specific methods to ensure taskbar is covered"""
-        import subprocess
-        import os
-
+        # wmctrl and xdotool hints chained in one shell that is not waited on -
+        # each is best effort and a missing tool must not skip the others.
+        # _NET_WM_STATE itself is requested by showFullScreen() over Qt's own X
+        # connection; writing the property with xprop after map is ignored by
+        # EWMH window managers, so no xprop call here
         try:
-            # Method 1: Try to set window properties using xprop (X11)
             window_id = int(self.winId())
-            subprocess.run(['xprop', '-id', str(window_id), '-set', '_NET_WM_STATE',
-                          '_NET_WM_STATE_FULLSCREEN'],
-                          check=False, capture_output=True, timeout=2)
-
-            # Method 2: Try wmctrl to maximize and remove decorations
-            subprocess.run(['wmctrl', '-r', 'Matrix Digital Rain Screensaver', '-b', 'add,fullscreen'],
-                          check=False, capture_output=True, timeout=2)
-
-            # Method 3: Try xdotool approach
-            subprocess.run(['xdotool', 'search', '--name', 'Matrix Digital Rain Screensaver',
-                          'windowstate', '--add', 'FULLSCREEN'],
-                          check=False, capture_output=True, timeout=2)
-
+            hints = (f"wmctrl -i -r {window_id:#x} -b add,fullscreen; "
+                     f"xdotool windowstate --add FULLSCREEN {window_id}")
+            subprocess.Popen(['sh', '-c', hints], stdout=subprocess.DEVNULL,
+                             stderr=subprocess.DEVNULL, start_new_session=True)
             print("🔧 Applied system-level fullscreen hints")
 
         except Exception as e:
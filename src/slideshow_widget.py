@@ -53,10 +53,12 @@ class SlideshowWidget(QWidget):
 
         # Timer for slide transitions
         self.slide_timer = QTimer()
+        self.slide_timer.setTimerType(Qt.TimerType.CoarseTimer)
         self.slide_timer.timeout.connect(self.next_slide)
 
         # Timer for FPS calculation
         self.fps_timer = QTimer()
+        self.fps_timer.setTimerType(Qt.TimerType.CoarseTimer)
         self.fps_timer.timeout.connect(self.update_fps)
         self.fps_timer.start(1000)  # Update FPS every second
 
@@ -90,13 +92,14 @@ class SlideshowWidget(QWidget):
             print(f"❌ Slideshow folder not found: {folder_path}")
             return
 
-        folder = Path(folder_path)
-        image_extensions = {'.jpg', '.jpeg', '.png', '.bmp', '.gif', '.tiff', '.webp'}
+        image_extensions = ('.jpg', '.jpeg', '.png', '.bmp', '.gif', '.tiff', '.webp')
 
-        # Collect all image files
-        for file_path in folder.iterdir():
-            if file_path.is_file() and file_path.suffix.lower() in image_extensions:
-                self.image_files.append(file_path)
+        # Collect all image files - scandir entries carry the file type from
+        # the directory read, so regular files need no extra stat() each
+        with os.scandir(folder_path) as entries:
+            for entry in entries:
+                if entry.name.lower().endswith(image_extensions) and entry.is_file():
+                    self.image_files.append(Path(entry.path))
 
         if not self.image_files:
             print(f"❌ No images found in folder: {folder_path}")
@@ -36,6 +36,30 @@ def log(message):
     print(f"[{timestamp}] {message}")
 
 
+def kill_orphaned_vlc():
+    """SIGKILL every process named like vlc - same match as `pkill -9 vlc`, without forking"""
+    own_pid = os.getpid()
+    try:
+        proc_entries = os.scandir('/proc')
+    except OSError:
+        return
+    with proc_entries:
+        for entry in proc_entries:
+            if not entry.name.isdigit():
+                continue
+            pid = int(entry.name)
+            if pid == own_pid:
+                continue
+            try:
+                with open(f'/proc/{pid}/comm', 'rb') as f:
+                    if b'vlc' not in f.read():
+                        continue
+                os.kill(pid, signal.SIGKILL)
+            except OSError:
+                # Process exited between listing and kill, or is not ours
+                continue
+
+
 class VideoPlayerWidget(QWidget):
     """VLC-based video player widget for screensaver"""
 
@@ -93,14 +117,10 @@ class VideoPlayerWidget(QWidget):
         self.stats_overlay.setAttribute(Qt.WidgetAttribute.WA_TransparentForMouseEvents)
         self.stats_overlay.hide()
 
-        # Timer for stats update
-        self.stats_timer = QTimer()
-        self.stats_timer.timeout.connect(self.update_stats_overlay)
-        self.stats_timer.start(1000)
-
-        # Timer to check if VLC process ended
+        # One 1 s tick: check if VLC process ended, then refresh stats if shown
         self.vlc_check_timer = QTimer()
-        self.vlc_check_timer.timeout.connect(self.check_vlc_status)
+        self.vlc_check_timer.setTimerType(Qt.TimerType.CoarseTimer)
+        self.vlc_check_timer.timeout.connect(self.on_tick)
         self.vlc_check_timer.start(1000)
 
         # Emergency CPU throttling
@@ -132,13 +152,13 @@ class VideoPlayerWidget(QWidget):
             log(f"❌ Video folder not found: {folder_path}")
             return
 
-        folder = Path(folder_path)
-        video_extensions = {'.mp4', '.mkv', '.avi', '.mov', '.webm', '.flv', '.wmv', '.m4v'}
+        video_extensions = ('.mp4', '.mkv', '.avi', '.mov', '.webm', '.flv', '.wmv', '.m4v')
 
         # Collect all video files
-        for file_path in folder.iterdir():
-            if file_path.is_file() and file_path.suffix.lower() in video_extensions:
-                self.video_files.append(file_path)
+        with os.scandir(folder_path) as entries:
+            for entry in entries:
+                if entry.name.lower().endswith(video_extensions) and entry.is_file():
+                    self.video_files.append(Path(entry.path))
 
         if not self.video_files:
             log(f"❌ No videos found in folder: {folder_path}")
@@ -253,9 +273,8 @@ class VideoPlayerWidget(QWidget):
                         self.vlc_process.wait(timeout=1)
                         log(f"   ✅ VLC force killed")
                     except (ProcessLookupError, OSError, subprocess.TimeoutExpired):
-                        # Last resort: use pkill to kill any remaining VLC processes
-                        log(f"   ⚠️ Using pkill as last resort...")
-                        subprocess.run(['pkill', '-9', 'vlc'], stderr=subprocess.DEVNULL)
+                        # Last resort: the orphan sweep below kills any remaining VLC processes
+                        log(f"   ⚠️ Force kill failed, sweeping remaining VLC processes...")
 
             except (ProcessLookupError, OSError) as e:
                 log(f"   ℹ️ VLC process already terminated: {e}")
@@ -263,10 +282,13 @@ class VideoPlayerWidget(QWidget):
                 self.vlc_process = None
 
         # Extra safety: kill any orphaned VLC processes
-        try:
-            subprocess.run(['pkill', '-9', 'vlc'], stderr=subprocess.DEVNULL, timeout=1)
-        except:
-            pass
+        kill_orphaned_vlc()
+
+    def on_tick(self):
+        """Periodic VLC watchdog and stats refresh"""
+        self.check_vlc_status()
+        if self.settings.get('show_stats', False):
+            self.update_stats_overlay()
 
     def check_vlc_status(self):
         """Check if VLC process has ended (shouldn't happen with looping playlist)"""